@@ -9,10 +9,13 @@ without requiring tkinter or GUI components.
 import sys
 import os
 import math
+import time
 import datetime
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -23,13 +26,31 @@ try:
         InputValidator, NavigationDataService, DISTANCE_TOLERANCE_M, 
         ANGLE_TOLERANCE_DEG, METERS_PER_NM, MAX_ITERATIONS,
         NEWTON_RAPHSON_TOLERANCE_M, GRADIENT_STEP_SIZE, MIN_SEARCH_RANGE_NM,
-        FileType
+        FileType, TARGET_COORDS_CACHE_SIZE, INTERSECTION_CACHE_SIZE, COORDINATE_PARSE_CACHE_SIZE
     )
     IMPORTS_AVAILABLE = True
 except ImportError as e:
     print(f"Import error: {e}")
     IMPORTS_AVAILABLE = False
 
+# Input validation cases as (input, description, should be rejected); built once at import
+COORDINATE_TEST_CASES = (
+    ("", "Empty string", True),
+    ("45.0", "Single number", True),
+    ("45.0 -75.0 extra", "Too many numbers", True),
+    ("not_a_number -75.0", "Invalid number", True),
+    ("45.0 not_a_number", "Invalid second number", True),
+    ("91.0 -75.0", "Invalid latitude", True),
+    ("45.0 -181.0", "Invalid longitude", True),
+)
+
+BEARING_TEST_CASES = (
+    ("", "Empty bearing", True),
+    ("360", "Bearing equals 360", True),
+    ("-1", "Negative bearing", True),
+    ("not_a_number", "Invalid bearing format", True),
+)
+
 class BugTester:
     """Comprehensive bug testing for the VOR calculation system."""
     
@@ -96,15 +117,28 @@ class BugTester:
             (-89.999999, -179.999999, "Near South Pole, near date line"),
         ]
         
+        valid_cases = []
         for lat, lon, description in edge_cases:
             try:
-                coords = Coordinates(lat, lon)
-                # Test basic operations
-                calc = CoordinateCalculator()
-                result = calc.calculate_target_coords_geodesic(coords, 45.0, 1.0)
+                Coordinates(lat, lon)
+                valid_cases.append((lat, lon, description))
             except Exception as e:
                 bugs_found.append(f"Coordinate edge case failure ({description}): {e}")
         
+        # Project all accepted edge cases in one batched call; at 1 NM this is
+        # the same Vincenty kernel the single-point path uses
+        if valid_cases:
+            lats, lons, descriptions = zip(*valid_cases)
+            try:
+                new_lats, new_lons = CoordinateCalculator.calculate_target_coords_batch(
+                    np.array(lats), np.array(lons), 45.0, 1.0
+                )
+                finite = np.isfinite(new_lats) & np.isfinite(new_lons)
+                for description in np.array(descriptions)[~finite]:
+                    bugs_found.append(f"Coordinate edge case failure ({description}): non-finite result")
+            except Exception as e:
+                bugs_found.append(f"Coordinate edge case failure (batch): {e}")
+        
         # Test invalid coordinates
         invalid_cases = [
             (91.0, 0.0, "Latitude too high"),
@@ -136,22 +170,10 @@ class BugTester:
         bugs_found = []
         
         # Test coordinate validation edge cases
-        test_cases = [
-            ("", "Empty string"),
-            ("45.0", "Single number"),
-            ("45.0 -75.0 extra", "Too many numbers"),
-            ("not_a_number -75.0", "Invalid number"),
-            ("45.0 not_a_number", "Invalid second number"),
-            ("91.0 -75.0", "Invalid latitude"),
-            ("45.0 -181.0", "Invalid longitude"),
-        ]
-        
-        for coords_str, description in test_cases:
+        for coords_str, description, is_invalid in COORDINATE_TEST_CASES:
             try:
                 result = InputValidator.validate_coordinates(coords_str)
-                if description in ["Empty string", "Single number", "Too many numbers", 
-                                 "Invalid number", "Invalid second number", 
-                                 "Invalid latitude", "Invalid longitude"]:
+                if is_invalid:
                     bugs_found.append(f"Invalid coordinates accepted: {description}")
             except ValueError:
                 # Expected for invalid inputs
@@ -160,17 +182,10 @@ class BugTester:
                 bugs_found.append(f"Unexpected error in coordinate validation ({description}): {e}")
         
         # Test bearing validation
-        bearing_cases = [
-            ("", "Empty bearing"),
-            ("360", "Bearing equals 360"),
-            ("-1", "Negative bearing"),
-            ("not_a_number", "Invalid bearing format"),
-        ]
-        
-        for bearing_str, description in bearing_cases:
+        for bearing_str, description, is_invalid in BEARING_TEST_CASES:
             try:
                 result = InputValidator.validate_bearing(bearing_str)
-                if description in ["Empty bearing", "Bearing equals 360", "Negative bearing", "Invalid bearing format"]:
+                if is_invalid:
                     bugs_found.append(f"Invalid bearing accepted: {description}")
             except ValueError:
                 # Expected for invalid inputs
@@ -198,10 +213,9 @@ class BugTester:
             start_coords = Coordinates(0.0, 0.0)
             
             # This should complete within reasonable time
-            import time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = calc.calculate_target_coords_geodesic(start_coords, 45.0, 10000.0)  # Very long distance
-            elapsed = time.time() - start_time
+            elapsed = (time.perf_counter_ns() - start_ns) * 1e-9
             
             if elapsed > 10.0:  # If it takes more than 10 seconds, it might be problematic
                 bugs_found.append(f"Very long calculation time for long distance: {elapsed:.2f}s")
@@ -257,13 +271,45 @@ class BugTester:
         # This is a basic test - in a real scenario we'd use memory profiling tools
         try:
             calc = CoordinateCalculator()
+            memoized = (
+                ("Target coordinate", CoordinateCalculator._cached_target_lat_lon),
+                ("Intersection", CoordinateCalculator._cached_radial_distance_intersection),
+                ("Coordinate parse", InputValidator._parse_coordinates),
+            )
+            for _, cached in memoized:
+                cached.cache_clear()
             
-            # Perform many calculations to see if memory grows excessively
-            for i in range(1000):
-                coords = Coordinates(float(i % 90), float(i % 180))
+            # Perform many single calculations with distinct inputs, so the
+            # memoizing caches fill up and have to evict
+            for i in range(2 * TARGET_COORDS_CACHE_SIZE):
+                coords = Coordinates(-80.0 + 160.0 * i / (2 * TARGET_COORDS_CACHE_SIZE), float(i % 180))
                 result = calc.calculate_target_coords_geodesic(coords, float(i % 360), 1.0)
             
-            # If we get here without issues, that's good
+            dme = Coordinates(40.2, -74.8)
+            for i in range(2 * INTERSECTION_CACHE_SIZE):
+                fix = Coordinates(40.0 + i * 1e-4, -75.0)
+                result = calc.find_radial_distance_intersection(fix, 45.0, dme, 20.0)
+            
+            for i in range(2 * COORDINATE_PARSE_CACHE_SIZE):
+                coords = InputValidator.validate_coordinates(f"{40.0 + i * 1e-4:.6f} -75.000000")
+            
+            # Each distinct input must be its own cache entry (rounding must not merge
+            # them), so every call missed and the full cache had to evict
+            for name, cached in memoized:
+                info = cached.cache_info()
+                if info.misses != 2 * info.maxsize or info.hits != 0:
+                    bugs_found.append(
+                        f"{name} cache saw {info.misses} misses and {info.hits} hits for {2 * info.maxsize} distinct inputs"
+                    )
+                if info.currsize != info.maxsize:
+                    bugs_found.append(f"{name} cache holds {info.currsize} entries after evicting, not {info.maxsize}")
+            
+            # Batch smoke check: one vectorized pass over the same kind of inputs
+            i = np.arange(1000, dtype=np.float64)
+            lats, lons = calc.calculate_target_coords_batch(i % 90, i % 180, i % 360, 1.0)
+            
+            if lats.shape != (1000,) or not (np.isfinite(lats).all() and np.isfinite(lons).all()):
+                bugs_found.append("Batch calculations returned missing or non-finite coordinates")
             
         except MemoryError:
             bugs_found.append("Memory error during repeated calculations")
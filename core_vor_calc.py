@@ -4,16 +4,63 @@ Core VOR calculation components extracted for testing without tkinter dependenci
 """
 
 import math
+import mmap
+import os
+import hashlib
+import tempfile
 import datetime
+import functools
 import importlib.util
+import threading
 from typing import Optional, Tuple, Dict, List, Any
 from dataclasses import dataclass
 from enum import Enum
 from geographiclib.geodesic import Geodesic
+import numpy as np
+from scipy.optimize import brentq
+
+import geodesic_kernel
 
 # Constants for the Earth's ellipsoid model with maximum precision settings
 GEODESIC = Geodesic.WGS84
 
+# Output masks requesting only the quantities the callers read; GeographicLib
+# skips the reduced length, geodesic scale and area series for the rest
+OUT_LATLON = Geodesic.LATITUDE | Geodesic.LONGITUDE
+OUT_LATLON_AZIMUTH = OUT_LATLON | Geodesic.AZIMUTH
+OUT_DISTANCE_AZIMUTH = Geodesic.DISTANCE | Geodesic.AZIMUTH
+# Capabilities of radial lines: positions by distance, returning lat/lon/azimuth
+RADIAL_LINE_CAPS = OUT_LATLON_AZIMUTH | Geodesic.DISTANCE_IN
+
+# pyproj wraps the C implementation of GeographicLib; when it is installed the
+# direct and inverse problems of target-coordinate calculation, validation and
+# the intersection search run there instead of in Python
+PYPROJ_AVAILABLE = importlib.util.find_spec("pyproj") is not None
+
+if PYPROJ_AVAILABLE:
+    from pyproj import Geod
+    _GEOD = Geod(ellps='WGS84')
+
+    def direct_lat_lon(lat1: float, lon1: float, azimuth: float, distance_m: float) -> Tuple[float, float]:
+        """Solve the direct problem; returns (lat2, lon2) in degrees."""
+        lon2, lat2, _ = _GEOD.fwd(lon1, lat1, azimuth, distance_m)
+        return lat2, lon2
+
+    def inverse_distance_azimuth(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+        """Solve the inverse problem; returns (distance in meters, azimuth at the first point)."""
+        azi1, _, distance_m = _GEOD.inv(lon1, lat1, lon2, lat2)
+        return distance_m, azi1
+else:
+    def direct_lat_lon(lat1: float, lon1: float, azimuth: float, distance_m: float) -> Tuple[float, float]:
+        """Solve the direct problem; returns (lat2, lon2) in degrees."""
+        result = GEODESIC.Direct(lat1, lon1, azimuth, distance_m, OUT_LATLON)
+        return result['lat2'], result['lon2']
+
+    def inverse_distance_azimuth(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+        """Solve the inverse problem; returns (distance in meters, azimuth at the first point)."""
+        result = GEODESIC.Inverse(lat1, lon1, lat2, lon2, OUT_DISTANCE_AZIMUTH)
+        return result['s12'], result['azi1']
+
 # Ultra high precision settings for intersection calculations
 MAX_ITERATIONS = 200  # Increased max iterations for better convergence with tight tolerance
 DISTANCE_TOLERANCE_NM = 0.00000054  # About 1 meter in nautical miles (1/1852)
@@ -23,7 +70,38 @@ ANGLE_TOLERANCE_DEG = 0.0001  # Extremely precise angular tolerance (about 0.36
 # Enhanced precision constants for improved accuracy
 NEWTON_RAPHSON_TOLERANCE_M = 0.1  # Even tighter tolerance for Newton-Raphson
 GRADIENT_STEP_SIZE = 0.001  # Small step size for numerical gradient calculation
+NEWTON_MAX_ITERATIONS = 20  # Newton converges quadratically; more steps mean it will not converge
+KERNEL_NEWTON_TOLERANCE_M = 0.001  # Vincenty pre-solve target; leaves one geographiclib check
+NEWTON_MIN_DERIVATIVE = 1e-6  # |d(distance)/ds| below this means the radial is tangent to the DME circle
 MIN_SEARCH_RANGE_NM = 0.000001  # Minimum search range to prevent infinite loops
+INTERSECTION_CACHE_SIZE = 1024  # Memoized intersection solutions
+TARGET_COORDS_CACHE_SIZE = 4096  # Memoized target-coordinate solutions
+# Trial distances per pass of the bracketing search; bisection unless a
+# vectorized geodesic backend makes evaluating many points nearly as cheap as one
+SEARCH_FAN_POINTS = 16 if (PYPROJ_AVAILABLE or geodesic_kernel.NUMBA_AVAILABLE) else 1
+VINCENTY_THRESHOLD_NM = 300.0  # Below this target coordinates use the Vincenty direct kernel
+
+# Identifier indexes of NAV/FIX files are cached as plain text in an app-owned
+# directory, never next to the data file
+INDEX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vor_fix_calculation", "indexes")
+INDEX_CACHE_VERSION = 4  # Bump when the index file layout changes
+
+# Declinations are cached per grid cell and day; ~100 m cells keep the snapping error below 0.01°
+DECLINATION_GRID_DEG = 0.001
+DECLINATION_CACHE_SIZE = 4096
+
+# Parsed coordinate strings kept so unchanged entries are not re-parsed
+COORDINATE_PARSE_CACHE_SIZE = 256
+
+# Mean Earth radius (IUGG), used only for spherical first guesses
+EARTH_MEAN_RADIUS_M = 6371008.8
+
+# FIX-DME separations up to which a local flat-earth (cheap ruler) first guess is used
+LOCAL_ESTIMATE_MAX_NM = 60.0
+
+# WGS84 first eccentricity squared and metres per degree of the equatorial radius
+WGS84_E2 = geodesic_kernel.WGS84_F * (2 - geodesic_kernel.WGS84_F)
+METERS_PER_DEGREE = geodesic_kernel.WGS84_A * math.pi / 180.0
 
 # Meters per nautical mile, defined exactly (constant should never be modified)
 METERS_PER_NM = 1852.0
@@ -40,6 +118,9 @@ class FileType(Enum):
     NAV = "NAV"
     FIX = "FIX"
 
+# Column holding the identifier in each data file type
+IDENTIFIER_COLUMNS = {FileType.NAV: 7, FileType.FIX: 2}
+
 @dataclass
 class Coordinates:
     """Represents geographic coordinates with validation."""
@@ -53,7 +134,26 @@ class Coordinates:
             raise ValueError(f"Longitude {self.lon} out of range [-180, 180]")
     
     def __str__(self) -> str:
-        return f"{self.lat:.9f} {self.lon:.9f}"
+        return "%.9f %.9f" % (self.lat, self.lon)
+    
+    @classmethod
+    def format_batch(cls, latitudes: np.ndarray, longitudes: np.ndarray) -> List[str]:
+        """Format many coordinate pairs exactly as __str__ does, without building instances."""
+        lats = np.asarray(latitudes, dtype=np.float64).ravel().tolist()
+        lons = np.asarray(longitudes, dtype=np.float64).ravel().tolist()
+        return ["%.9f %.9f" % pair for pair in zip(lats, lons)]
+
+@dataclass(frozen=True)
+class IntersectionResult:
+    """Result of a radial/DME intersection search.
+    
+    Frozen only shallowly: coordinates is a mutable Coordinates, so results
+    are never shared between callers (the solver cache stores plain floats).
+    """
+    __slots__ = ("coordinates", "radial_distance_nm", "residual_m")
+    coordinates: Coordinates  # Intersection point on the radial
+    radial_distance_nm: float  # Distance from the FIX along the radial
+    residual_m: float  # Remaining error of the point's distance from the DME
 
 class CoordinateCalculator:
     """Service for performing coordinate calculations."""
@@ -68,70 +168,549 @@ class CoordinateCalculator:
         """Convert nautical miles to meters with high precision."""
         return nm * METERS_PER_NM
 
+    @staticmethod
+    def normalize_bearing(bearing: float) -> float:
+        """Normalize a bearing into the [0, 360) degree range."""
+        x = math.fmod(bearing, 360.0)
+        return x + 360.0 if x < 0 else x
+
+    @staticmethod
+    def angle_difference(a: float, b: float) -> float:
+        """Smallest angle in degrees between two bearings, in any range."""
+        diff = abs(a - b) % 360.0
+        return 360.0 - diff if diff > 180.0 else diff
+
     @staticmethod
     def calculate_target_coords_geodesic(
         start_coords: Coordinates, 
         azimuth: float, 
         distance_nm: float
     ) -> Coordinates:
-        """Calculate target coordinates with ultra-high precision and adaptive refinement."""
+        """Calculate target coordinates by solving the direct geodesic problem.
+        
+        Typical VOR/DME distances are solved with the Vincenty direct kernel
+        (Numba-compiled when available), which agrees with geographiclib to
+        within micrometres there. Longer distances use GeographicLib's Direct
+        (its C build via pyproj when installed), which is accurate to
+        nanometres on the ellipsoid, so neither result needs a round-trip
+        Inverse check.
+        
+        Results are memoized on the inputs rounded to 9 decimals, so repeated
+        start point, azimuth and distance combinations skip the solve.
+        """
+        return Coordinates(*CoordinateCalculator._cached_target_lat_lon(
+            round(start_coords.lat, 9), round(start_coords.lon, 9), round(azimuth, 9), round(distance_nm, 9)
+        ))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=TARGET_COORDS_CACHE_SIZE)
+    def _cached_target_lat_lon(lat: float, lon: float, azimuth: float, distance_nm: float) -> Tuple[float, float]:
+        """Memoized direct solve on rounded inputs; returns (lat2, lon2)."""
         distance_m = CoordinateCalculator.nm_to_meters(distance_nm)
         
-        # Use high-precision direct calculation
-        result = GEODESIC.Direct(start_coords.lat, start_coords.lon, azimuth, distance_m)
-        initial_coords = Coordinates(result['lat2'], result['lon2'])
+        if distance_nm < VINCENTY_THRESHOLD_NM:
+            lat2, lon2, _ = geodesic_kernel.vincenty_direct(lat, lon, azimuth, distance_m)
+            return lat2, lon2
+        
+        return direct_lat_lon(lat, lon, azimuth, distance_m)
+
+    @staticmethod
+    def calculate_target_coords_batch(
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        azimuths: np.ndarray,
+        distances_nm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Project many start points at once; returns (lat, lon) arrays.
+        
+        Uses the Vincenty kernels in geodesic_kernel, which are compiled with
+        Numba when it is installed. Inputs broadcast against each other.
+        """
+        distances_m = np.asarray(distances_nm, dtype=np.float64) * METERS_PER_NM
+        lat2, lon2, _ = geodesic_kernel.direct(latitudes, longitudes, azimuths, distances_m)
+        return lat2, lon2
+
+    @staticmethod
+    def geodesic_line(start_coords: Coordinates, azimuth: float, caps: int = RADIAL_LINE_CAPS):
+        """Create a geodesic line from a start point along an azimuth.
+        
+        Positions along a fixed radial are much cheaper to evaluate on a
+        line object than with repeated Direct calls from the same origin.
+        The default caps support Position calls returning latitude, longitude
+        and azimuth only, so the line skips the unused series coefficients.
+        """
+        return GEODESIC.Line(start_coords.lat, start_coords.lon, azimuth, caps)
+
+    @staticmethod
+    def find_radial_distance_intersection(
+        fix_coords: Coordinates, 
+        true_bearing: float, 
+        dme_coords: Coordinates, 
+        distance_nm: float
+    ) -> IntersectionResult:
+        """Find where a radial from a FIX meets a distance circle around a DME.
+        
+        The result holds the intersection point, its distance (NM) along the
+        radial and the remaining error (meters) of its distance from the DME.
+        The point is on the radial by construction, so no separate
+        verification is needed.
         
-        # Verify the calculation with inverse calculation
-        verification = GEODESIC.Inverse(
-            start_coords.lat, start_coords.lon, 
-            result['lat2'], result['lon2']
+        Results are memoized on the inputs rounded to 1e-9 degree
+        (coordinates) and 1e-6 (bearing, distance), so repeating a calculation
+        while other fields change costs a dictionary lookup. The cache holds
+        plain floats; every call gets its own Coordinates and result.
+        """
+        lat, lon, radial_distance_nm, residual_m = CoordinateCalculator._cached_radial_distance_intersection(
+            round(fix_coords.lat, 9), round(fix_coords.lon, 9), round(true_bearing, 6),
+            round(dme_coords.lat, 9), round(dme_coords.lon, 9), round(distance_nm, 6)
         )
-        actual_distance_m = verification['s12']
-        distance_error_m = abs(actual_distance_m - distance_m)
-        
-        # If error is acceptable, return immediately
-        if distance_error_m <= DISTANCE_TOLERANCE_M:
-            return initial_coords
-        
-        # For distances with higher error, use adaptive multi-step approach
-        optimal_coords = initial_coords
-        min_error = distance_error_m
-        
-        # Try different step sizes to find optimal accuracy
-        step_sizes = [100, 250, 500, 1000]  # Different step sizes in km
-        
-        for step_size_km in step_sizes:
-            if distance_nm < step_size_km / 1.852:  # Convert km to nm
-                continue  # Skip if distance is smaller than step size
-                
-            num_steps = max(2, int(distance_nm * 1.852 / step_size_km))
-            step_coords = start_coords
-            step_distance = distance_m / num_steps
-            
-            # Multi-step calculation with verification at each step
-            for step in range(num_steps):
-                step_result = GEODESIC.Direct(
-                    step_coords.lat, step_coords.lon, azimuth, step_distance
+        return IntersectionResult(Coordinates(lat, lon), radial_distance_nm, residual_m)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=INTERSECTION_CACHE_SIZE)
+    def _cached_radial_distance_intersection(
+        fix_lat: float,
+        fix_lon: float,
+        true_bearing: float,
+        dme_lat: float,
+        dme_lon: float,
+        distance_nm: float
+    ) -> Tuple[float, float, float, float]:
+        """Memoized solve on quantized inputs; returns (lat, lon, radial_distance_nm, residual_m)."""
+        result = CoordinateCalculator._solve_radial_distance_intersection(
+            Coordinates(fix_lat, fix_lon), true_bearing, Coordinates(dme_lat, dme_lon), distance_nm
+        )
+        return result.coordinates.lat, result.coordinates.lon, result.radial_distance_nm, result.residual_m
+
+    @staticmethod
+    def _solve_radial_distance_intersection(
+        fix_coords: Coordinates, 
+        true_bearing: float, 
+        dme_coords: Coordinates, 
+        distance_nm: float
+    ) -> IntersectionResult:
+        """Run the Newton iteration with bracketing fallback (uncached)."""
+        distance_m = CoordinateCalculator.nm_to_meters(distance_nm)
+        
+        # Every trial point lies on the same radial, so build its geodesic once
+        radial_line = CoordinateCalculator.geodesic_line(fix_coords, true_bearing)
+        
+        initial_distance_nm = CoordinateCalculator._local_radial_distance_estimate_nm(
+            fix_coords, true_bearing, dme_coords, distance_m
+        )
+        
+        # Otherwise the FIX-DME geodesic seeds the estimate and the search range; solve it once
+        fix_dme_distance_m = None
+        if initial_distance_nm is None:
+            fix_dme_distance_m, bearing_to_dme = inverse_distance_azimuth(
+                fix_coords.lat, fix_coords.lon, dme_coords.lat, dme_coords.lon
+            )
+            initial_distance_nm = CoordinateCalculator._estimate_radial_distance_nm(
+                fix_dme_distance_m, bearing_to_dme, true_bearing, distance_m
+            )
+            if initial_distance_nm is None:
+                # The radial misses the circle or only touches it; settle it without searching
+                result = CoordinateCalculator._closest_radial_point_intersection(
+                    radial_line, dme_coords, distance_m, fix_dme_distance_m, bearing_to_dme, true_bearing
                 )
-                step_coords = Coordinates(step_result['lat2'], step_result['lon2'])
+                if result is not None:
+                    return result
+        
+        if initial_distance_nm is not None:
+            # Converge with the (Numba-compiled when available) Vincenty kernels first;
+            # the geographiclib Newton pass then normally only confirms the result
+            refined_m = geodesic_kernel.radial_intersection_distance(
+                fix_coords.lat, fix_coords.lon, true_bearing, dme_coords.lat, dme_coords.lon,
+                distance_m, initial_distance_nm * METERS_PER_NM, KERNEL_NEWTON_TOLERANCE_M, NEWTON_MAX_ITERATIONS
+            )
+            if not math.isnan(refined_m):
+                initial_distance_nm = refined_m / METERS_PER_NM
             
-            # Final verification for this approach
-            final_verification = GEODESIC.Inverse(
-                start_coords.lat, start_coords.lon,
-                step_coords.lat, step_coords.lon
+            try:
+                result = CoordinateCalculator._newton_raphson_intersection(
+                    radial_line, dme_coords, distance_m, initial_distance_nm
+                )
+                if result is not None:
+                    return result
+            except Exception:
+                pass  # Fall back to binary search if the Newton iteration fails
+        
+        # Enhanced binary search with adaptive refinement
+        return CoordinateCalculator._enhanced_binary_search_intersection(
+            fix_coords, dme_coords, distance_m, radial_line, fix_dme_distance_m
+        )
+
+    @staticmethod
+    def find_radial_distance_intersections_batch(
+        fix_lats: np.ndarray,
+        fix_lons: np.ndarray,
+        true_bearings: np.ndarray,
+        dme_lats: np.ndarray,
+        dme_lons: np.ndarray,
+        distances_nm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Solve many radial/DME intersections in lock-step.
+        
+        Returns (lat, lon, radial distance NM, residual m) arrays; entries with
+        no solution, or whose Newton iteration does not converge, are NaN.
+        Every iteration makes one direct and one inverse call over all
+        unconverged entries using the Vincenty kernels in geodesic_kernel.
+        Inputs broadcast against each other.
+        """
+        (fix_lats, fix_lons, true_bearings, dme_lats, dme_lons, distances_nm), shape = \
+            geodesic_kernel._as_columns(fix_lats, fix_lons, true_bearings, dme_lats, dme_lons, distances_nm)
+        distances_m = distances_nm * METERS_PER_NM
+        
+        # Spherical-triangle starting guesses, as in _estimate_radial_distance_nm
+        fix_dme_m, bearing_to_dme, _ = geodesic_kernel.inverse(fix_lats, fix_lons, dme_lats, dme_lons)
+        cos_angle = np.cos(np.radians(true_bearings - bearing_to_dme))
+        b = fix_dme_m / EARTH_MEAN_RADIUS_M
+        amplitude = np.hypot(np.cos(b), np.sin(b) * cos_angle)
+        phase = np.arctan2(np.sin(b) * cos_angle, np.cos(b))
+        with np.errstate(invalid='ignore'):
+            offset = np.arccos(np.cos(distances_m / EARTH_MEAN_RADIUS_M) / amplitude)
+        near = (phase - offset) * EARTH_MEAN_RADIUS_M
+        far = (phase + offset) * EARTH_MEAN_RADIUS_M
+        radial_m = np.maximum(0.0, np.where(np.minimum(near, far) > 0, np.minimum(near, far), np.maximum(near, far)))
+        radial_m = np.where(fix_dme_m == 0, distances_m, radial_m)
+        
+        lats = np.full_like(radial_m, np.nan)
+        lons = np.full_like(radial_m, np.nan)
+        residuals_m = np.full_like(radial_m, np.nan)
+        solved_m = np.full_like(radial_m, np.nan)
+        active = np.flatnonzero(~np.isnan(radial_m))
+        
+        for iteration in range(NEWTON_MAX_ITERATIONS):
+            if active.size == 0:
+                break
+            s = radial_m[active]
+            point_lats, point_lons, radial_azimuths = geodesic_kernel.direct(
+                fix_lats[active], fix_lons[active], true_bearings[active], s
+            )
+            to_dme_m, azimuths_to_dme, _ = geodesic_kernel.inverse(
+                point_lats, point_lons, dme_lats[active], dme_lons[active]
             )
-            final_distance_error = abs(final_verification['s12'] - distance_m)
+            errors_m = to_dme_m - distances_m[active]
+            
+            done = np.abs(errors_m) < NEWTON_RAPHSON_TOLERANCE_M
+            finished = active[done]
+            lats[finished] = point_lats[done]
+            lons[finished] = point_lons[done]
+            residuals_m[finished] = np.abs(errors_m[done])
+            solved_m[finished] = s[done]
+            
+            derivatives = -np.cos(np.radians(azimuths_to_dme - radial_azimuths))
+            # Converged entries and near-tangent geometry drop out of the iteration
+            keep = ~done & (np.abs(derivatives) >= NEWTON_MIN_DERIVATIVE)
+            active = active[keep]
+            radial_m[active] = np.abs(s[keep] - errors_m[keep] / derivatives[keep])
+        
+        return (lats.reshape(shape), lons.reshape(shape),
+                (solved_m / METERS_PER_NM).reshape(shape), residuals_m.reshape(shape))
+
+    @staticmethod
+    def _local_radial_distance_estimate_nm(
+        fix_coords: Coordinates, 
+        true_bearing: float, 
+        dme_coords: Coordinates, 
+        distance_m: float
+    ) -> Optional[float]:
+        """Estimate the radial distance in a local flat frame around the FIX.
+        
+        Uses the WGS84 "cheap ruler" scale factors at the mid latitude, so no
+        geodesic problem is solved; the result is typically within tens of
+        metres, which the Newton iteration removes in a step or two. Returns
+        None when the DME is too far away for the approximation or the radial
+        misses the circle in the flat frame.
+        """
+        cos_lat = math.cos(math.radians((fix_coords.lat + dme_coords.lat) / 2))
+        w2 = 1 / (1 - WGS84_E2 * (1 - cos_lat * cos_lat))
+        w = math.sqrt(w2)
+        kx = METERS_PER_DEGREE * w * cos_lat
+        ky = METERS_PER_DEGREE * w * w2 * (1 - WGS84_E2)
+        
+        dx = ((dme_coords.lon - fix_coords.lon + 540.0) % 360.0 - 180.0) * kx
+        dy = (dme_coords.lat - fix_coords.lat) * ky
+        fix_dme_m_sq = dx * dx + dy * dy
+        if fix_dme_m_sq > (LOCAL_ESTIMATE_MAX_NM * METERS_PER_NM) ** 2:
+            return None
+        
+        # Points s * (sin, cos)(bearing) on the radial at distance_m from the DME
+        bearing_rad = math.radians(true_bearing)
+        along = dx * math.sin(bearing_rad) + dy * math.cos(bearing_rad)
+        discriminant = along * along - fix_dme_m_sq + distance_m * distance_m
+        if discriminant < 0:
+            return None
+        
+        root = math.sqrt(discriminant)
+        near, far = along - root, along + root
+        return CoordinateCalculator.meters_to_nm(max(0.0, near if near > 0 else far))
+
+    @staticmethod
+    def _estimate_radial_distance_nm(
+        fix_dme_distance_m: float, 
+        bearing_to_dme: float, 
+        true_bearing: float, 
+        distance_m: float
+    ) -> Optional[float]:
+        """Estimate the distance along the radial to the DME circle, or None if there is none.
+        
+        Solves the spherical triangle FIX-P-DME for the side x along the
+        radial: cos(c) = cos(b)cos(x) + sin(b)sin(x)cos(A), with b the FIX-DME
+        side, c the DME distance and A the angle at the FIX. Fed with the
+        ellipsoidal FIX-DME distance and azimuth, this is typically within a
+        few millimetres of the final answer at terminal-area ranges.
+        """
+        # Geometric solution for initial guess
+        if fix_dme_distance_m == 0:
+            return CoordinateCalculator.meters_to_nm(distance_m)
+        
+        angle_rad = math.radians(CoordinateCalculator.angle_difference(true_bearing, bearing_to_dme))
+        b = fix_dme_distance_m / EARTH_MEAN_RADIUS_M
+        c = distance_m / EARTH_MEAN_RADIUS_M
+        
+        # Write the right-hand side as amplitude * cos(x - phase) and solve for x
+        amplitude = math.hypot(math.cos(b), math.sin(b) * math.cos(angle_rad))
+        ratio = math.cos(c) / amplitude
+        if abs(ratio) > 1:
+            return None  # No real solution
+        
+        phase = math.atan2(math.sin(b) * math.cos(angle_rad), math.cos(b))
+        offset = math.acos(ratio)
+        distance1 = (phase - offset) * EARTH_MEAN_RADIUS_M
+        distance2 = (phase + offset) * EARTH_MEAN_RADIUS_M
+        
+        # Choose the positive solution closest to expected range
+        initial_distance_m = max(0, min(distance1, distance2) if min(distance1, distance2) > 0 else max(distance1, distance2))
+        return CoordinateCalculator.meters_to_nm(initial_distance_m)
+
+    @staticmethod
+    def _closest_radial_point_intersection(
+        radial_line, 
+        dme_coords: Coordinates, 
+        distance_m: float,
+        fix_dme_distance_m: float, 
+        bearing_to_dme: float, 
+        true_bearing: float
+    ) -> Optional[IntersectionResult]:
+        """Answer with the point of the radial closest to the DME when the circle does not cross it.
+        
+        On the sphere the foot of the perpendicular from the DME lies at the
+        along-track distance atan2(sin(b)cos(A), cos(b)) from the FIX (the
+        phase used by _estimate_radial_distance_nm), clamped to the start of
+        the radial. One Position and one Inverse give its actual distance
+        from the DME: if that is no closer than the DME distance (within
+        DISTANCE_TOLERANCE_M), the point is the tangent solution or the best
+        approximation and is returned with its residual. Otherwise the
+        ellipsoid does reach the circle where the sphere does not, and None
+        sends the caller on to the bracketing search.
+        """
+        angle_rad = math.radians(CoordinateCalculator.angle_difference(true_bearing, bearing_to_dme))
+        b = fix_dme_distance_m / EARTH_MEAN_RADIUS_M
+        along_m = max(0.0, math.atan2(math.sin(b) * math.cos(angle_rad), math.cos(b)) * EARTH_MEAN_RADIUS_M)
+        
+        point = radial_line.Position(along_m, OUT_LATLON)
+        to_dme_m, _ = inverse_distance_azimuth(point['lat2'], point['lon2'], dme_coords.lat, dme_coords.lon)
+        error_m = to_dme_m - distance_m
+        if error_m < -DISTANCE_TOLERANCE_M:
+            return None
+        return IntersectionResult(Coordinates(point['lat2'], point['lon2']), along_m / METERS_PER_NM, abs(error_m))
+
+    @staticmethod
+    def _newton_raphson_intersection(
+        radial_line, 
+        dme_coords: Coordinates, 
+        distance_m: float,
+        initial_distance_nm: float
+    ) -> Optional[IntersectionResult]:
+        """Refine the radial distance with Newton steps using the geodesic derivative.
+        
+        For f(s) = dist(P(s), DME) - D, moving along the radial changes the
+        distance to the DME at the rate -cos(azimuth to the DME minus radial
+        azimuth at P), both of which Position and Inverse already return. Each
+        iteration therefore costs one Position and one Inverse. Returns None
+        when the radial is near tangent to the circle so the caller can fall
+        back to bisection.
+        """
+        dme_lat, dme_lon = dme_coords.lat, dme_coords.lon
+        # Iterate in meters and bind the per-iteration callables locally
+        current_m = initial_distance_nm * METERS_PER_NM
+        position = radial_line.Position
+        inverse = inverse_distance_azimuth
+        cos, radians = math.cos, math.radians
+        
+        for iteration in range(NEWTON_MAX_ITERATIONS):
+            point = position(current_m, OUT_LATLON_AZIMUTH)
+            to_dme_m, azimuth_to_dme = inverse(point['lat2'], point['lon2'], dme_lat, dme_lon)
+            error_m = to_dme_m - distance_m
+            
+            if -NEWTON_RAPHSON_TOLERANCE_M < error_m < NEWTON_RAPHSON_TOLERANCE_M:
+                return IntersectionResult(
+                    Coordinates(point['lat2'], point['lon2']), current_m / METERS_PER_NM, abs(error_m)
+                )
+            
+            derivative = -cos(radians(azimuth_to_dme - point['azi2']))
+            if -NEWTON_MIN_DERIVATIVE < derivative < NEWTON_MIN_DERIVATIVE:
+                break  # Near-tangent geometry; Newton steps are unreliable
             
-            # Keep the most accurate result
-            if final_distance_error < min_error:
-                min_error = final_distance_error
-                optimal_coords = step_coords
-                
-                # If we achieved excellent accuracy, stop searching
-                if min_error <= DISTANCE_TOLERANCE_M:
-                    break
+            # Prevent negative distances
+            current_m = abs(current_m - error_m / derivative)
         
-        return optimal_coords
+        return None  # Failed to converge
+
+    @staticmethod
+    def _enhanced_binary_search_intersection(
+        fix_coords: Coordinates, 
+        dme_coords: Coordinates, 
+        distance_m: float,
+        radial_line,
+        fix_dme_distance_m: Optional[float] = None
+    ) -> IntersectionResult:
+        """Enhanced bracketing search with adaptive range and precision refinement.
+        
+        Each pass evaluates SEARCH_FAN_POINTS evenly spaced radial distances
+        and keeps the sub-interval bracketing a crossing of the DME distance
+        (or, without one, around the smallest error). With a single point
+        this is plain bisection; with a vectorized geodesic backend the range
+        shrinks by roughly that factor per pass for one array call. As soon as
+        the range ends straddle the target distance, scipy's brentq finishes
+        the search.
+        """
+        # Calculate distance between FIX and DME unless the caller already has it
+        if fix_dme_distance_m is None:
+            fix_dme_distance_m, _ = inverse_distance_azimuth(fix_coords.lat, fix_coords.lon, dme_coords.lat, dme_coords.lon)
+        fix_dme_distance_nm = CoordinateCalculator.meters_to_nm(fix_dme_distance_m)
+        distance_nm = CoordinateCalculator.meters_to_nm(distance_m)
+        
+        # Intelligent search range determination
+        if distance_nm < 0.05:
+            min_dist, max_dist = 0.0, 0.2
+        elif distance_nm < 0.5:
+            min_dist, max_dist = 0.0, max(1.0, distance_nm * 2)
+        else:
+            # Use geometric constraints for better range estimation
+            margin = max(1.0, distance_nm * 0.1)  # Adaptive margin
+            min_dist = max(0.0, abs(fix_dme_distance_nm - distance_nm) - margin)
+            max_dist = fix_dme_distance_nm + distance_nm + margin
+        
+        # Validate and adjust search range
+        if min_dist >= max_dist or (max_dist - min_dist) < MIN_SEARCH_RANGE_NM:
+            min_dist = 0.0
+            max_dist = max(1.0, distance_nm * 2)
+        
+        position = radial_line.Position
+        dme_lat, dme_lon = dme_coords.lat, dme_coords.lon
+        
+        # radial distance -> (lat, lon, signed error) for every scalar evaluation,
+        # so the reported point never needs a second Position or Inverse
+        evaluated: Dict[float, Tuple[float, float, float]] = {}
+        
+        def error_at(radial_nm: float) -> float:
+            point = position(radial_nm * METERS_PER_NM, OUT_LATLON)
+            to_dme_m, _ = inverse_distance_azimuth(point['lat2'], point['lon2'], dme_lat, dme_lon)
+            evaluated[radial_nm] = (point['lat2'], point['lon2'], to_dme_m - distance_m)
+            return to_dme_m - distance_m
+        
+        # Signed errors at the current range ends
+        min_error_m = error_at(min_dist)
+        max_error_m = error_at(max_dist)
+        
+        # Enhanced search with precision tracking
+        best_approx_distance = float('inf')
+        best_approx_radial_nm = 0.0
+        fractions = np.arange(1, SEARCH_FAN_POINTS + 1) / (SEARCH_FAN_POINTS + 1)
+        
+        # Track convergence for adaptive precision
+        last_improvement_pass = 0
+        
+        for search_pass in range(MAX_ITERATIONS):
+            # Once the range brackets a single sign change, Brent's method converges superlinearly
+            if min_error_m * max_error_m < 0:
+                root_nm = brentq(error_at, min_dist, max_dist, xtol=MIN_SEARCH_RANGE_NM, maxiter=MAX_ITERATIONS)
+                root_error_m = abs(evaluated[root_nm][2] if root_nm in evaluated else error_at(root_nm))
+                if root_error_m < best_approx_distance:
+                    best_approx_distance = root_error_m
+                    best_approx_radial_nm = root_nm
+                break
+            
+            test_dists = min_dist + (max_dist - min_dist) * fractions
+            test_errors_m = CoordinateCalculator._radial_distances_to_point(
+                radial_line, test_dists, dme_coords
+            ) - distance_m
+            errors_m = np.abs(test_errors_m)
+            
+            # Track best approximation
+            best = int(np.argmin(errors_m))
+            if errors_m[best] < best_approx_distance:
+                best_approx_distance = float(errors_m[best])
+                best_approx_radial_nm = float(test_dists[best])
+                last_improvement_pass = search_pass
+            
+            # Check for convergence
+            if best_approx_distance < DISTANCE_TOLERANCE_M:
+                break
+            
+            # Adaptive precision: if no improvement for many passes, use current best
+            if search_pass - last_improvement_pass > 20:
+                break
+            
+            # Adjust search range with enhanced logic
+            beyond = test_errors_m > 0
+            if len(test_dists) == 1:
+                if beyond[0]:
+                    max_dist, max_error_m = float(test_dists[0]), float(test_errors_m[0])
+                else:
+                    min_dist, min_error_m = float(test_dists[0]), float(test_errors_m[0])
+            else:
+                crossings = np.flatnonzero(beyond[1:] != beyond[:-1])
+                if crossings.size:
+                    # Bracket the crossing closest to the best point so far
+                    i = int(crossings[np.argmin(np.abs(crossings + 0.5 - best))])
+                    min_dist, min_error_m = float(test_dists[i]), float(test_errors_m[i])
+                    max_dist, max_error_m = float(test_dists[i + 1]), float(test_errors_m[i + 1])
+                else:
+                    # No crossing in this fan: close in on the smallest error
+                    if best > 0:
+                        min_dist, min_error_m = float(test_dists[best - 1]), float(test_errors_m[best - 1])
+                    if best < len(test_dists) - 1:
+                        max_dist, max_error_m = float(test_dists[best + 1]), float(test_errors_m[best + 1])
+            
+            # Enhanced termination condition
+            range_size = max_dist - min_dist
+            if range_size < MIN_SEARCH_RANGE_NM:
+                break
+        
+        # Report the point from the same geodesic line the Newton path uses
+        if best_approx_radial_nm in evaluated:
+            best_lat, best_lon, _ = evaluated[best_approx_radial_nm]
+        else:
+            point = position(best_approx_radial_nm * METERS_PER_NM, OUT_LATLON)
+            best_lat, best_lon = point['lat2'], point['lon2']
+        return IntersectionResult(Coordinates(best_lat, best_lon), best_approx_radial_nm, best_approx_distance)
+
+    @staticmethod
+    def _radial_distances_to_point(radial_line, radial_distances_nm: np.ndarray, target: Coordinates) -> np.ndarray:
+        """Distances (meters) from points along a radial to a target point."""
+        if len(radial_distances_nm) == 1:
+            point = radial_line.Position(radial_distances_nm[0] * METERS_PER_NM, OUT_LATLON)
+            distance_m, _ = inverse_distance_azimuth(point['lat2'], point['lon2'], target.lat, target.lon)
+            return np.array([distance_m])
+        
+        radial_distances_m = radial_distances_nm * METERS_PER_NM
+        if PYPROJ_AVAILABLE:
+            count = len(radial_distances_m)
+            lons, lats, _ = _GEOD.fwd(
+                np.full(count, radial_line.lon1), np.full(count, radial_line.lat1),
+                np.full(count, radial_line.azi1), radial_distances_m
+            )
+            _, _, distances_m = _GEOD.inv(lons, lats, np.full(count, target.lon), np.full(count, target.lat))
+            return np.asarray(distances_m)
+        
+        lats, lons, _ = geodesic_kernel.direct(
+            radial_line.lat1, radial_line.lon1, radial_line.azi1, radial_distances_m
+        )
+        distances_m, _, _ = geodesic_kernel.inverse(lats, lons, target.lat, target.lon)
+        return distances_m
 
     @staticmethod
     def validate_calculation_accuracy(
@@ -141,19 +720,14 @@ class CoordinateCalculator:
         expected_distance_nm: float
     ) -> Dict[str, float]:
         """Validate the accuracy of a coordinate calculation."""
-        result = GEODESIC.Inverse(start_coords.lat, start_coords.lon, end_coords.lat, end_coords.lon)
-        
-        actual_distance_m = result['s12']
+        actual_distance_m, azimuth = inverse_distance_azimuth(
+            start_coords.lat, start_coords.lon, end_coords.lat, end_coords.lon
+        )
         actual_distance_nm = CoordinateCalculator.meters_to_nm(actual_distance_m)
-        actual_azimuth = result['azi1']
-        
-        # Normalize azimuths to 0-360 range
-        actual_azimuth = actual_azimuth % 360
-        expected_azimuth = expected_azimuth % 360
+        actual_azimuth = CoordinateCalculator.normalize_bearing(azimuth)
         
         # Calculate azimuth difference (shortest angular distance)
-        azimuth_diff = abs(actual_azimuth - expected_azimuth)
-        azimuth_diff = min(azimuth_diff, 360 - azimuth_diff)
+        azimuth_diff = CoordinateCalculator.angle_difference(actual_azimuth, expected_azimuth)
         
         distance_error_nm = abs(actual_distance_nm - expected_distance_nm)
         distance_error_m = abs(actual_distance_m - CoordinateCalculator.nm_to_meters(expected_distance_nm))
@@ -167,6 +741,56 @@ class CoordinateCalculator:
             'accuracy_rating': CoordinateCalculator._calculate_accuracy_rating(distance_error_m, azimuth_diff)
         }
     
+    @staticmethod
+    def validate_calculation_accuracy_batch(
+        start_lats: np.ndarray,
+        start_lons: np.ndarray,
+        end_lats: np.ndarray,
+        end_lons: np.ndarray,
+        expected_azimuths: np.ndarray,
+        expected_distances_nm: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Validate many calculations at once; returns arrays keyed like validate_calculation_accuracy.
+        
+        With pyproj every inverse problem is solved in one C call; otherwise
+        geographiclib solves them one by one, exactly as the single-point
+        version does. Inputs broadcast against each other.
+        """
+        (start_lats, start_lons, end_lats, end_lons, expected_azimuths, expected_distances_nm), shape = \
+            geodesic_kernel._as_columns(start_lats, start_lons, end_lats, end_lons, expected_azimuths, expected_distances_nm)
+        
+        if PYPROJ_AVAILABLE:
+            azimuths, _, distances_m = _GEOD.inv(start_lons, start_lats, end_lons, end_lats)
+            actual_distances_m = np.asarray(distances_m)
+            actual_azimuths = np.asarray(azimuths)
+        else:
+            inverses = [
+                GEODESIC.Inverse(lat1, lon1, lat2, lon2, OUT_DISTANCE_AZIMUTH)
+                for lat1, lon1, lat2, lon2 in zip(start_lats.tolist(), start_lons.tolist(),
+                                                  end_lats.tolist(), end_lons.tolist())
+            ]
+            actual_distances_m = np.array([result['s12'] for result in inverses], dtype=np.float64)
+            actual_azimuths = np.array([result['azi1'] for result in inverses], dtype=np.float64)
+        
+        actual_azimuths = np.mod(actual_azimuths, 360.0)
+        azimuth_diffs = np.abs(actual_azimuths - expected_azimuths) % 360.0
+        azimuth_diffs = np.where(azimuth_diffs > 180.0, 360.0 - azimuth_diffs, azimuth_diffs)
+        actual_distances_nm = actual_distances_m / METERS_PER_NM
+        distance_errors_m = np.abs(actual_distances_m - expected_distances_nm * METERS_PER_NM)
+        ratings = [
+            CoordinateCalculator._calculate_accuracy_rating(distance_error_m, azimuth_diff)
+            for distance_error_m, azimuth_diff in zip(distance_errors_m.tolist(), azimuth_diffs.tolist())
+        ]
+        
+        return {
+            'distance_error_nm': np.abs(actual_distances_nm - expected_distances_nm).reshape(shape),
+            'distance_error_m': distance_errors_m.reshape(shape),
+            'azimuth_error_deg': azimuth_diffs.reshape(shape),
+            'actual_distance_nm': actual_distances_nm.reshape(shape),
+            'actual_azimuth_deg': actual_azimuths.reshape(shape),
+            'accuracy_rating': np.array(ratings).reshape(shape)
+        }
+    
     @staticmethod
     def _calculate_accuracy_rating(distance_error_m: float, azimuth_error_deg: float) -> str:
         """Calculate accuracy rating based on errors."""
@@ -197,32 +821,48 @@ class CoordinateCalculator:
                 'total_calculations': 0
             }
         
-        distance_errors = []
-        azimuth_errors = []
-        
-        for start_coords, end_coords, expected_azimuth, expected_distance_nm in calculations:
-            metrics = CoordinateCalculator.validate_calculation_accuracy(
-                start_coords, end_coords, expected_azimuth, expected_distance_nm
-            )
-            distance_errors.append(metrics['distance_error_m'])
-            azimuth_errors.append(metrics['azimuth_error_deg'])
+        # Solve all the inverse problems in one batched call, then reduce the arrays
+        start_lats, start_lons, end_lats, end_lons, expected_azimuths, expected_distances_nm = zip(*[
+            (start.lat, start.lon, end.lat, end.lon, azimuth, distance_nm)
+            for start, end, azimuth, distance_nm in calculations
+        ])
+        metrics = CoordinateCalculator.validate_calculation_accuracy_batch(
+            start_lats, start_lons, end_lats, end_lons, expected_azimuths, expected_distances_nm
+        )
+        distance_errors = metrics['distance_error_m']
+        azimuth_errors = metrics['azimuth_error_deg']
         
         return {
-            'mean_distance_error_m': sum(distance_errors) / len(distance_errors),
-            'max_distance_error_m': max(distance_errors),
-            'min_distance_error_m': min(distance_errors),
-            'mean_azimuth_error_deg': sum(azimuth_errors) / len(azimuth_errors),
-            'max_azimuth_error_deg': max(azimuth_errors),
-            'min_azimuth_error_deg': min(azimuth_errors),
+            'mean_distance_error_m': float(distance_errors.mean()),
+            'max_distance_error_m': float(distance_errors.max()),
+            'min_distance_error_m': float(distance_errors.min()),
+            'mean_azimuth_error_deg': float(azimuth_errors.mean()),
+            'max_azimuth_error_deg': float(azimuth_errors.max()),
+            'min_azimuth_error_deg': float(azimuth_errors.min()),
             'total_calculations': len(calculations)
         }
 
 class InputValidator:
     """Validates user input for the application."""
     
+    @staticmethod
+    def _parse_float(value: str, name: str) -> float:
+        """Convert an entry value to float, naming the field on failure."""
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"{name} must be a number") from None
+    
     @staticmethod
     def validate_coordinates(coords_str: str) -> Coordinates:
         """Validate and parse coordinate string."""
+        # A fresh instance each call, since Coordinates is mutable
+        return Coordinates(*InputValidator._parse_coordinates(coords_str))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=COORDINATE_PARSE_CACHE_SIZE)
+    def _parse_coordinates(coords_str: str) -> Tuple[float, float]:
+        """Parse and range-check a coordinate string (memoized; errors are not cached)."""
         if not coords_str.strip():
             raise ValueError("Coordinates cannot be empty")
         
@@ -232,7 +872,8 @@ class InputValidator:
         
         try:
             lat, lon = map(float, parts)
-            return Coordinates(lat, lon)
+            Coordinates(lat, lon)  # Range check only
+            return lat, lon
         except ValueError as e:
             if "could not convert" in str(e):
                 raise ValueError("Coordinates must be valid numbers")
@@ -241,15 +882,15 @@ class InputValidator:
     @staticmethod
     def validate_bearing(bearing_str: str) -> float:
         """Validate bearing input."""
-        try:
-            bearing = float(bearing_str)
-            if not (0 <= bearing < 360):
-                raise ValueError("Bearing should be within 0-359 degrees")
-            return bearing
-        except ValueError as e:
-            if "could not convert" in str(e):
-                raise ValueError("Bearing must be a number")
-            raise e
+        bearing = InputValidator._parse_float(bearing_str, "Bearing")
+        if not (0 <= bearing < 360):
+            raise ValueError("Bearing should be within 0-359 degrees")
+        return bearing
+
+def index_cache_path(file_path: str) -> str:
+    """Path of the cached identifier index for a data file, named by a hash of its absolute path."""
+    digest = hashlib.sha256(os.fsencode(os.path.abspath(file_path))).hexdigest()
+    return os.path.join(INDEX_CACHE_DIR, digest + ".idx")
 
 class NavigationDataService:
     """Service for reading and searching navigation data files."""
@@ -257,13 +898,42 @@ class NavigationDataService:
     def __init__(self):
         self.nav_file_path = ""
         self.fix_file_path = ""
+        # file type -> ((path, mtime_ns, size), identifier -> raw matching lines, as bytes);
+        # without a background build the index is None until the same file is queried twice
+        self._indexes: Dict[FileType, Tuple[Tuple[str, int, int], Optional[Dict[bytes, List[bytes]]]]] = {}
+        # file type -> event set once the background index build for the current path finishes
+        self._index_ready: Dict[FileType, threading.Event] = {}
     
     def set_file_path(self, file_type: FileType, path: str) -> None:
-        """Set the file path for the specified file type."""
+        """Set the file path for the specified file type and start indexing it in the background."""
         if file_type == FileType.NAV:
             self.nav_file_path = path
         else:
             self.fix_file_path = path
+        
+        ready = threading.Event()
+        self._index_ready[file_type] = ready
+        if path:
+            threading.Thread(target=self._preload_index, args=(file_type, path, ready), daemon=True).start()
+        else:
+            ready.set()
+    
+    def _preload_index(self, file_type: FileType, file_path: str, ready: threading.Event) -> None:
+        """Build (or load the cached) index for a newly selected file."""
+        try:
+            stat = os.stat(file_path)
+            key = (file_path, stat.st_mtime_ns, stat.st_size)
+            index = self._read_index_cache(file_path, key)
+            if index is None:
+                index = self._load_index(file_path, IDENTIFIER_COLUMNS[file_type])
+                self._write_index_cache(file_path, key, index)
+            # Drop the result if another file was selected while this one was being read
+            if self._index_ready.get(file_type) is ready:
+                self._indexes[file_type] = (key, index)
+        except Exception:
+            pass  # Errors are reported by search_identifier when the file is queried
+        finally:
+            ready.set()
     
     def search_identifier(
         self, 
@@ -277,31 +947,176 @@ class NavigationDataService:
         if not file_path:
             raise FileNotFoundError(f"No {file_type.value} file selected")
         
+        ready = self._index_ready.get(file_type)
+        if ready is not None:
+            ready.wait()
+        
+        identifier = identifier.upper()
+        relevant_index = IDENTIFIER_COLUMNS[file_type]
         try:
-            with open(file_path, 'r') as file:
-                matching_lines = []
-                for line in file:
-                    parts = line.strip().split()
-                    relevant_index = 7 if file_type == FileType.NAV else 2
-                    
-                    if (len(parts) > relevant_index and 
-                        parts[relevant_index] == identifier.upper()):
-                        matching_lines.append(parts)
-                
-                return matching_lines
+            stat = os.stat(file_path)
+            key = (file_path, stat.st_mtime_ns, stat.st_size)
+            cached = self._indexes.get(file_type)
+            if cached is None or cached[0] != key:
+                index = self._read_index_cache(file_path, key)
+                self._indexes[file_type] = (key, index)
+                if index is None:
+                    # A one-off lookup is cheaper as a filtered scan than a full index build
+                    return self._scan_file(file_path, relevant_index, identifier)
+            else:
+                index = cached[1]
+            if index is None:
+                index = self._load_index(file_path, relevant_index)
+                self._indexes[file_type] = (key, index)
+                self._write_index_cache(file_path, key, index)
+            return [line.decode(errors='replace').split() for line in index.get(identifier.encode(), ())]
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         except Exception as e:
             raise Exception(f"Error reading {file_type.value} file: {e}")
+    
+    @staticmethod
+    def _index_cache_header(key: Tuple[str, int, int]) -> bytes:
+        """Header lines of an index file: layout version, data file mtime and size, then its path."""
+        return b"%d %d %d\n%s\n" % (INDEX_CACHE_VERSION, key[1], key[2], os.fsencode(os.path.abspath(key[0])))
+    
+    @staticmethod
+    def _read_index_cache(
+        file_path: str,
+        key: Tuple[str, int, int]
+    ) -> Optional[Dict[bytes, List[bytes]]]:
+        """Load the cached index of a data file if it matches the file's path, size and mtime.
+        
+        After the header the file holds one 'identifier<TAB>raw line' entry
+        per line; raw lines come from bytes.splitlines, so they hold no newline.
+        """
+        header = NavigationDataService._index_cache_header(key)
+        try:
+            with open(index_cache_path(file_path), 'rb') as cache_file:
+                data = cache_file.read()
+            if not data.startswith(header):
+                return None
+            index: Dict[bytes, List[bytes]] = {}
+            for entry in data[len(header):].split(b"\n"):
+                if entry:
+                    identifier, line = entry.split(b"\t", 1)
+                    index.setdefault(identifier, []).append(line)
+            return index
+        except Exception:
+            pass  # Missing, stale or unreadable caches are simply rebuilt
+        return None
+    
+    @staticmethod
+    def _write_index_cache(
+        file_path: str,
+        key: Tuple[str, int, int],
+        index: Dict[bytes, List[bytes]]
+    ) -> None:
+        """Save an index to the cache directory; failures (e.g. no writable home) are ignored."""
+        try:
+            os.makedirs(INDEX_CACHE_DIR, exist_ok=True)
+            # Write a temporary file and rename it so readers never see a partial index
+            fd, temp_path = tempfile.mkstemp(dir=INDEX_CACHE_DIR)
+            try:
+                with os.fdopen(fd, 'wb') as cache_file:
+                    cache_file.write(NavigationDataService._index_cache_header(key))
+                    cache_file.write(b"".join(
+                        b"%s\t%s\n" % (identifier, line) for identifier, lines in index.items() for line in lines
+                    ))
+                os.replace(temp_path, index_cache_path(file_path))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _scan_file(file_path: str, relevant_index: int, identifier: str) -> List[List[str]]:
+        """Scan a data file for one identifier, splitting only lines that contain it."""
+        needle = identifier.encode()
+        matching_lines = []
+        if not needle:
+            return matching_lines  # An empty identifier matches no field
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return matching_lines  # mmap cannot map an empty file
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                pos = buffer.find(needle)
+                while pos != -1:
+                    start = buffer.rfind(b'\n', 0, pos) + 1
+                    end = buffer.find(b'\n', pos)
+                    if end == -1:
+                        end = len(buffer)
+                    parts = buffer[start:end].decode(errors='replace').split()
+                    if len(parts) > relevant_index and parts[relevant_index] == identifier:
+                        matching_lines.append(parts)
+                    pos = buffer.find(needle, end + 1)  # Past the newline, so the scan always advances
+        return matching_lines
+    
+    @staticmethod
+    def _load_index(file_path: str, relevant_index: int) -> Dict[bytes, List[bytes]]:
+        """Read a data file once and group its raw lines by identifier.
+        
+        The file is read as bytes in one call and split with bytes.splitlines,
+        avoiding per-line readline and decode overhead. Only the fields up to
+        the identifier are split here; lines are decoded and split fully when
+        a lookup returns them.
+        """
+        index: Dict[bytes, List[bytes]] = {}
+        maxsplit = relevant_index + 1
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        for line in data.splitlines():
+            parts = line.split(None, maxsplit)
+            if len(parts) > relevant_index:
+                index.setdefault(parts[relevant_index], []).append(line)
+        return index
 
 class MagneticDeclinationService:
     """Service for calculating magnetic declination."""
     
-    def __init__(self):
-        self._initialize_geomag()
+    def __init__(self, initialize: bool = True):
+        self.pygeomag_available = False
+        self.geomag_initialized = False
+        self._ready = threading.Event()
+        # Set by whichever of the constructor, initialize_async or the first lookup loads the model
+        self._load_started = False
+        self._load_lock = threading.Lock()
+        self._grid_declination = functools.lru_cache(maxsize=DECLINATION_CACHE_SIZE)(
+            self._calculate_grid_declination
+        )
+        if initialize:
+            self._wait_until_ready()
+    
+    def initialize_async(self) -> threading.Thread:
+        """Load the GeoMag model on a daemon thread; lookups wait until it is ready."""
+        thread = threading.Thread(target=self._wait_until_ready, daemon=True)
+        thread.start()
+        return thread
+    
+    def _wait_until_ready(self) -> None:
+        """Load the GeoMag model unless another caller already is, then wait for it.
+        
+        Without initialize=True or initialize_async(), the first lookup loads it.
+        """
+        if self._ready.is_set():
+            return
+        with self._load_lock:
+            load_here = not self._load_started
+            self._load_started = True
+        if load_here:
+            self._initialize_geomag()
+        self._ready.wait()
     
     def _initialize_geomag(self) -> None:
         """Initialize the GeoMag library if available."""
+        try:
+            self._load_geomag()
+        finally:
+            self._ready.set()
+    
+    def _load_geomag(self) -> None:
+        """Import pygeomag and load its model, preferring high resolution."""
         try:
             spec = importlib.util.find_spec("pygeomag")
             if spec is not None:
@@ -327,13 +1142,33 @@ class MagneticDeclinationService:
     
     def get_declination(self, coordinates: Coordinates, altitude_m: float = 0.0, date: Optional[datetime.datetime] = None) -> float:
         """Calculate magnetic declination at the given coordinates with enhanced precision."""
+        self._wait_until_ready()
         if not (self.pygeomag_available and self.geomag_initialized):
             return 0.0
         
+        if date is not None:
+            return self._calculate_declination(coordinates.lat, coordinates.lon, altitude_m, date)
+        
+        # Current-date lookups snap to the grid so repeated calculations reuse the model result
+        return self._grid_declination(
+            round(coordinates.lat / DECLINATION_GRID_DEG),
+            round(coordinates.lon / DECLINATION_GRID_DEG),
+            altitude_m,
+            datetime.date.today().toordinal()
+        )
+    
+    def _calculate_grid_declination(self, lat_cell: int, lon_cell: int, altitude_m: float, day: int) -> float:
+        """Declination at a grid cell centre at the start of the given day (cached per instance)."""
+        return self._calculate_declination(
+            lat_cell * DECLINATION_GRID_DEG,
+            lon_cell * DECLINATION_GRID_DEG,
+            altitude_m,
+            datetime.datetime.fromordinal(day)
+        )
+    
+    def _calculate_declination(self, lat: float, lon: float, altitude_m: float, target_date: datetime.datetime) -> float:
+        """Evaluate the GeoMag model at a point and date."""
         try:
-            # Use provided date or current date
-            target_date = date or datetime.datetime.today()
-            
             # Calculate decimal year with high precision
             year_start = datetime.datetime(target_date.year, 1, 1)
             year_end = datetime.datetime(target_date.year + 1, 1, 1)
@@ -345,8 +1180,8 @@ class MagneticDeclinationService:
             altitude_km = altitude_m / 1000.0
             
             result = self.geo_mag.calculate(
-                glat=coordinates.lat, 
-                glon=coordinates.lon, 
+                glat=lat, 
+                glon=lon, 
                 alt=altitude_km, 
                 time=decimal_year
             )
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Vincenty geodesic kernels for batch calculations on the WGS84 ellipsoid.
+
+The scalar kernels are compiled with Numba when it is installed and run as
+plain Python otherwise. The array wrappers accept NumPy arrays (or scalars
+that broadcast against them) and return float64 arrays.
+
+Vincenty's formulae are accurate to well under a millimetre for the
+distances used in terminal-area work, so single target-coordinate
+calculations below VINCENTY_THRESHOLD_NM use vincenty_direct too. The
+inverse may fail to converge for nearly antipodal points, so single
+distance and azimuth lookups keep using geographiclib.
+"""
+
+import math
+import importlib.util
+from typing import Tuple
+
+import numpy as np
+
+# WGS84 ellipsoid
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = WGS84_A * (1 - WGS84_F)
+
+VINCENTY_TOLERANCE = 1e-12  # Convergence threshold in radians
+VINCENTY_MAX_ITERATIONS = 200
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+    def _jit(func):
+        """Compile a kernel with Numba, caching the machine code on disk."""
+        return njit(cache=True, fastmath=True)(func)
+else:
+    def _jit(func):
+        """Run kernels as plain Python when Numba is not installed."""
+        return func
+
+
+@_jit
+def vincenty_direct(lat1: float, lon1: float, azimuth: float, distance_m: float) -> Tuple[float, float, float]:
+    """Solve the direct problem; returns (lat2, lon2, azi2) in degrees."""
+    a = WGS84_A
+    b = WGS84_B
+    f = WGS84_F
+
+    alpha1 = math.radians(azimuth)
+    sin_alpha1 = math.sin(alpha1)
+    cos_alpha1 = math.cos(alpha1)
+
+    tan_u1 = (1 - f) * math.tan(math.radians(lat1))
+    cos_u1 = 1 / math.sqrt(1 + tan_u1 * tan_u1)
+    sin_u1 = tan_u1 * cos_u1
+
+    sigma1 = math.atan2(tan_u1, cos_alpha1)
+    sin_alpha = cos_u1 * sin_alpha1
+    cos2_alpha = 1 - sin_alpha * sin_alpha
+    u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+    big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+
+    sigma = distance_m / (b * big_a)
+    cos_2sm = math.cos(2 * sigma1 + sigma)
+    sin_sigma = math.sin(sigma)
+    cos_sigma = math.cos(sigma)
+    for _ in range(VINCENTY_MAX_ITERATIONS):
+        cos_2sm = math.cos(2 * sigma1 + sigma)
+        sin_sigma = math.sin(sigma)
+        cos_sigma = math.cos(sigma)
+        delta_sigma = big_b * sin_sigma * (
+            cos_2sm + big_b / 4 * (
+                cos_sigma * (-1 + 2 * cos_2sm * cos_2sm)
+                - big_b / 6 * cos_2sm * (-3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos_2sm * cos_2sm)
+            )
+        )
+        sigma_next = distance_m / (b * big_a) + delta_sigma
+        if abs(sigma_next - sigma) < VINCENTY_TOLERANCE:
+            sigma = sigma_next
+            cos_2sm = math.cos(2 * sigma1 + sigma)
+            sin_sigma = math.sin(sigma)
+            cos_sigma = math.cos(sigma)
+            break
+        sigma = sigma_next
+
+    x = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1
+    lat2 = math.atan2(
+        sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+        (1 - f) * math.sqrt(sin_alpha * sin_alpha + x * x)
+    )
+    lam = math.atan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
+    c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+    big_l = lam - (1 - c) * f * sin_alpha * (
+        sigma + c * sin_sigma * (cos_2sm + c * cos_sigma * (-1 + 2 * cos_2sm * cos_2sm))
+    )
+
+    lon2 = math.fmod(lon1 + math.degrees(big_l) + 540.0, 360.0) - 180.0
+    azi2 = math.degrees(math.atan2(sin_alpha, -x))
+    return math.degrees(lat2), lon2, azi2
+
+
+@_jit
+def vincenty_inverse(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float, float]:
+    """Solve the inverse problem; returns (distance_m, azi1, azi2) with azimuths in degrees."""
+    a = WGS84_A
+    b = WGS84_B
+    f = WGS84_F
+
+    big_l = math.radians(lon2 - lon1)
+    tan_u1 = (1 - f) * math.tan(math.radians(lat1))
+    cos_u1 = 1 / math.sqrt(1 + tan_u1 * tan_u1)
+    sin_u1 = tan_u1 * cos_u1
+    tan_u2 = (1 - f) * math.tan(math.radians(lat2))
+    cos_u2 = 1 / math.sqrt(1 + tan_u2 * tan_u2)
+    sin_u2 = tan_u2 * cos_u2
+
+    lam = big_l
+    sin_lam = math.sin(lam)
+    cos_lam = math.cos(lam)
+    sin_sigma = 0.0
+    cos_sigma = 1.0
+    sigma = 0.0
+    cos2_alpha = 1.0
+    cos_2sm = 0.0
+    for _ in range(VINCENTY_MAX_ITERATIONS):
+        sin_lam = math.sin(lam)
+        cos_lam = math.cos(lam)
+        cross = cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam
+        sin_sigma = math.sqrt((cos_u2 * sin_lam) ** 2 + cross * cross)
+        if sin_sigma == 0:
+            return 0.0, 0.0, 0.0  # Coincident points
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lam / sin_sigma
+        cos2_alpha = 1 - sin_alpha * sin_alpha
+        # Both points on the equator leave cos2_alpha at zero
+        cos_2sm = cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha if cos2_alpha != 0 else 0.0
+        c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+        lam_prev = lam
+        lam = big_l + (1 - c) * f * sin_alpha * (
+            sigma + c * sin_sigma * (cos_2sm + c * cos_sigma * (-1 + 2 * cos_2sm * cos_2sm))
+        )
+        if abs(lam - lam_prev) < VINCENTY_TOLERANCE:
+            sin_lam = math.sin(lam)
+            cos_lam = math.cos(lam)
+            break
+
+    u_sq = cos2_alpha * (a * a - b * b) / (b * b)
+    big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (320 - 175 * u_sq)))
+    big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    delta_sigma = big_b * sin_sigma * (
+        cos_2sm + big_b / 4 * (
+            cos_sigma * (-1 + 2 * cos_2sm * cos_2sm)
+            - big_b / 6 * cos_2sm * (-3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos_2sm * cos_2sm)
+        )
+    )
+    distance_m = b * big_a * (sigma - delta_sigma)
+
+    azi1 = math.atan2(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+    azi2 = math.atan2(cos_u1 * sin_lam, -sin_u1 * cos_u2 + cos_u1 * sin_u2 * cos_lam)
+    return distance_m, math.degrees(azi1), math.degrees(azi2)
+
+
+@_jit
+def radial_intersection_distance(lat1: float, lon1: float, azimuth: float, lat_target: float, lon_target: float,
+                                 distance_m: float, initial_m: float, tolerance_m: float, max_iterations: int) -> float:
+    """Find the distance along a geodesic at which the distance to a target equals distance_m.
+    
+    Newton iteration using d(distance to target)/ds = -cos(azimuth to target
+    minus geodesic azimuth); returns NaN if it does not converge.
+    """
+    s = initial_m
+    for _ in range(max_iterations):
+        lat2, lon2, azi2 = vincenty_direct(lat1, lon1, azimuth, s)
+        to_target_m, azi_to_target, _ = vincenty_inverse(lat2, lon2, lat_target, lon_target)
+        error_m = to_target_m - distance_m
+        if abs(error_m) < tolerance_m:
+            return s
+        derivative = -math.cos(math.radians(azi_to_target - azi2))
+        if abs(derivative) < 1e-6:
+            return math.nan  # Near-tangent geometry
+        s = abs(s - error_m / derivative)
+    return math.nan
+
+
+@_jit
+def _direct_many(lat1, lon1, azimuth, distance_m, lat2, lon2, azi2):
+    for i in range(lat1.shape[0]):
+        lat2[i], lon2[i], azi2[i] = vincenty_direct(lat1[i], lon1[i], azimuth[i], distance_m[i])
+
+
+@_jit
+def _inverse_many(lat1, lon1, lat2, lon2, distance_m, azi1, azi2):
+    for i in range(lat1.shape[0]):
+        distance_m[i], azi1[i], azi2[i] = vincenty_inverse(lat1[i], lon1[i], lat2[i], lon2[i])
+
+
+def _as_columns(*arrays):
+    """Broadcast inputs together and return them as flat float64 columns plus the common shape."""
+    broadcast = np.broadcast_arrays(*[np.asarray(x, dtype=np.float64) for x in arrays])
+    shape = broadcast[0].shape
+    return [np.ascontiguousarray(x).ravel() for x in broadcast], shape
+
+
+def direct(lat1, lon1, azimuth, distance_m) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized direct problem; returns (lat2, lon2, azi2) arrays in degrees."""
+    (lat1, lon1, azimuth, distance_m), shape = _as_columns(lat1, lon1, azimuth, distance_m)
+    lat2 = np.empty_like(lat1)
+    lon2 = np.empty_like(lat1)
+    azi2 = np.empty_like(lat1)
+    _direct_many(lat1, lon1, azimuth, distance_m, lat2, lon2, azi2)
+    return lat2.reshape(shape), lon2.reshape(shape), azi2.reshape(shape)
+
+
+def inverse(lat1, lon1, lat2, lon2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized inverse problem; returns (distance_m, azi1, azi2) arrays."""
+    (lat1, lon1, lat2, lon2), shape = _as_columns(lat1, lon1, lat2, lon2)
+    distance_m = np.empty_like(lat1)
+    azi1 = np.empty_like(lat1)
+    azi2 = np.empty_like(lat1)
+    _inverse_many(lat1, lon1, lat2, lon2, distance_m, azi1, azi2)
+    return distance_m.reshape(shape), azi1.reshape(shape), azi2.reshape(shape)
+
+
+def warm_up() -> None:
+    """Run every kernel once so Numba compiles (or loads from its cache) ahead of the first real call."""
+    vincenty_direct(0.0, 0.0, 45.0, 1000.0)
+    vincenty_inverse(0.0, 0.0, 0.01, 0.01)
+    radial_intersection_distance(0.0, 0.0, 45.0, 0.01, 0.01, 1000.0, 1000.0, 1e-3, 1)
+    point = np.zeros(1)
+    direct(point, point, point, point)
+    inverse(point, point, point, point)
+
+
+if NUMBA_AVAILABLE:
+    warm_up()  # Keep JIT latency out of the first interactive calculation
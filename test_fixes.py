@@ -5,11 +5,17 @@ Test script to verify that the bug fixes work correctly.
 
 import sys
 import os
+import math
+import tempfile
+import threading
 
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core_vor_calc import Coordinates, CoordinateCalculator
+from core_vor_calc import (
+    Coordinates, CoordinateCalculator, NavigationDataService, FileType, index_cache_path,
+    MagneticDeclinationService
+)
 
 def test_longitude_boundary_fix():
     """Test that -180.0 longitude is now accepted."""
@@ -133,6 +139,203 @@ def test_edge_cases():
         print(f"❌ Edge case test failed: {e}")
         return False
 
+def test_radial_distance_intersection():
+    """Test that the DME intersection lies on both the radial and the DME circle."""
+    print("Testing radial/DME intersection...")
+    
+    try:
+        fix = Coordinates(40.0, -100.0)
+        dme = Coordinates(40.5, -99.5)
+        result = CoordinateCalculator.find_radial_distance_intersection(fix, 45.0, dme, 20.0)
+        point, radial_nm, error_m = result.coordinates, result.radial_distance_nm, result.residual_m
+        
+        expected = CoordinateCalculator.calculate_target_coords_geodesic(fix, 45.0, radial_nm)
+        if abs(point.lat - expected.lat) > 1e-9 or abs(point.lon - expected.lon) > 1e-9:
+            print("❌ Intersection is not on the radial")
+            return False
+        
+        to_dme = CoordinateCalculator.validate_calculation_accuracy(dme, point, 0.0, 20.0)
+        if to_dme['distance_error_m'] > 1.0:
+            print(f"❌ Intersection is {to_dme['distance_error_m']:.3f}m off the DME circle")
+            return False
+        if abs(to_dme['distance_error_m'] - error_m) > 1e-6:
+            print("❌ Reported residual does not match the actual error")
+            return False
+        
+        # Memoized results must not hand the same mutable Coordinates to two callers
+        repeat = CoordinateCalculator.find_radial_distance_intersection(fix, 45.0, dme, 20.0)
+        if repeat != result or repeat.coordinates is point:
+            print("❌ Repeated intersection shares its coordinates with the first result")
+            return False
+        
+        print("✅ Intersection found on radial and DME circle")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Intersection test failed: {e}")
+        return False
+
+def test_batch_target_coords():
+    """Test that the batch kernel agrees with the geographiclib single-point path."""
+    print("Testing batch target coordinates...")
+    
+    try:
+        starts = [Coordinates(45.0, -75.0), Coordinates(-33.9, 151.2), Coordinates(89.0, 0.0)]
+        azimuths = [90.0, 225.0, 10.0]
+        distances_nm = [1.0, 50.0, 120.0]
+        
+        lats, lons = CoordinateCalculator.calculate_target_coords_batch(
+            [c.lat for c in starts], [c.lon for c in starts], azimuths, distances_nm
+        )
+        
+        for i, start in enumerate(starts):
+            expected = CoordinateCalculator.calculate_target_coords_geodesic(start, azimuths[i], distances_nm[i])
+            if abs(lats[i] - expected.lat) > 1e-8 or abs(lons[i] - expected.lon) > 1e-8:
+                print(f"❌ Batch result {i} differs from single-point result")
+                return False
+        
+        if Coordinates.format_batch(lats, lons) != [str(Coordinates(lat, lon)) for lat, lon in zip(lats, lons)]:
+            print("❌ Batch formatting differs from Coordinates.__str__")
+            return False
+        
+        print("✅ Batch results match single-point results")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Batch calculation test failed: {e}")
+        return False
+
+def test_batch_intersections():
+    """Test that the lock-step batch solver agrees with the single intersection solver."""
+    print("Testing batch radial/DME intersections...")
+    
+    try:
+        fixes = [Coordinates(40.0, -100.0), Coordinates(51.5, -0.1), Coordinates(45.0, -75.0)]
+        dmes = [Coordinates(40.5, -99.5), Coordinates(51.2, -0.3), Coordinates(46.0, -75.0)]
+        bearings = [45.0, 200.0, 90.0]
+        distances_nm = [20.0, 3.0, 10.0]  # The last radial never reaches the DME circle
+        
+        lats, lons, radial_nm, residual_m = CoordinateCalculator.find_radial_distance_intersections_batch(
+            [c.lat for c in fixes], [c.lon for c in fixes], bearings,
+            [c.lat for c in dmes], [c.lon for c in dmes], distances_nm
+        )
+        
+        for i in range(2):
+            point = CoordinateCalculator.find_radial_distance_intersection(
+                fixes[i], bearings[i], dmes[i], distances_nm[i]
+            ).coordinates
+            if abs(lats[i] - point.lat) > 1e-6 or abs(lons[i] - point.lon) > 1e-6:
+                print(f"❌ Batch intersection {i} differs from single solver")
+                return False
+            if not residual_m[i] < 1.0:
+                print(f"❌ Batch intersection {i} residual too large: {residual_m[i]}")
+                return False
+        
+        if not math.isnan(lats[2]):
+            print("❌ Expected no solution for the third entry")
+            return False
+        
+        print("✅ Batch intersections match single solver")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Batch intersection test failed: {e}")
+        return False
+
+def test_navigation_index_refresh():
+    """Test that identifier lookups follow edits to the selected file."""
+    print("Testing navigation index refresh...")
+    
+    fd, path = tempfile.mkstemp(suffix=".dat")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write("40.0 -75.0 ABC ENRT K6\n41.0 -76.0 ABC ENRT K6\n")
+        
+        service = NavigationDataService()
+        service.set_file_path(FileType.FIX, path)
+        if len(service.search_identifier("abc", FileType.FIX)) != 2:
+            print("❌ Expected two matches for ABC")
+            return False
+        
+        # The background build caches the index as text in the app's cache directory
+        reloaded = NavigationDataService()
+        reloaded.fix_file_path = path
+        if reloaded.search_identifier("ABC", FileType.FIX) != service.search_identifier("ABC", FileType.FIX):
+            print("❌ Cached index does not match the data file")
+            return False
+        if not os.path.exists(index_cache_path(path)) or os.path.dirname(index_cache_path(path)) == os.path.dirname(path):
+            print("❌ Index not cached in the cache directory")
+            return False
+        
+        with open(path, 'a') as f:
+            f.write("42.0 -77.0 XYZW ENRT K6\n")
+        if service.search_identifier("XYZW", FileType.FIX) != [["42.0", "-77.0", "XYZW", "ENRT", "K6"]]:
+            print("❌ Index not rebuilt after file change")
+            return False
+        
+        print("✅ Index follows file changes")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Navigation index test failed: {e}")
+        return False
+    finally:
+        os.remove(path)
+        if os.path.exists(index_cache_path(path)):
+            os.remove(index_cache_path(path))
+
+def test_navigation_scan_empty_identifier():
+    """Test that an unindexed lookup of an empty identifier returns no matches."""
+    print("Testing empty identifier scan...")
+    
+    fd, path = tempfile.mkstemp(suffix=".dat")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write("40.0 -75.0 ABC ENRT K6\n41.0 -76.0 ABCD ENRT K6\n")
+        
+        # No background build and no cached index, so lookups scan the file
+        service = NavigationDataService()
+        service.fix_file_path = path
+        if service.search_identifier("", FileType.FIX) != []:
+            print("❌ Empty identifier returned matches")
+            return False
+        if service.search_identifier("ABC", FileType.FIX) != [["40.0", "-75.0", "ABC", "ENRT", "K6"]]:
+            print("❌ Scan did not return the single ABC line")
+            return False
+        
+        print("✅ Empty identifier returns no matches")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Empty identifier test failed: {e}")
+        return False
+    finally:
+        os.remove(path)
+
+def test_lazy_declination_service():
+    """Test that a service created without initializing loads the model on its first lookup."""
+    print("Testing lazily initialized declination service...")
+    
+    try:
+        service = MagneticDeclinationService(initialize=False)
+        results = []
+        # Run the lookup on a thread so a regression fails the test instead of hanging it
+        lookup = threading.Thread(
+            target=lambda: results.append(service.get_declination(Coordinates(45.0, -75.0))), daemon=True
+        )
+        lookup.start()
+        lookup.join(30)
+        if lookup.is_alive() or len(results) != 1:
+            print("❌ First lookup did not load the declination model")
+            return False
+        
+        print("✅ First lookup loads the declination model")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Declination service test failed: {e}")
+        return False
+
 def main():
     """Run all fix verification tests."""
     print("VOR Fix Calculation - Fix Verification Tests")
@@ -142,7 +345,13 @@ def main():
         test_longitude_boundary_fix,
         test_precision_metrics_fix,
         test_coordinate_calculations,
-        test_edge_cases
+        test_edge_cases,
+        test_radial_distance_intersection,
+        test_batch_target_coords,
+        test_batch_intersections,
+        test_navigation_index_refresh,
+        test_navigation_scan_empty_identifier,
+        test_lazy_declination_service
     ]
     
     passed = 0
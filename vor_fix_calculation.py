@@ -2,16 +2,63 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from geographiclib.geodesic import Geodesic
 import math
+import mmap
 import os
+import hashlib
+import tempfile
+import numpy as np
+from scipy.optimize import brentq
 import datetime
+import functools
 import importlib.util
+import threading
+import time
 from typing import Optional, Tuple, Dict, List, Any
 from dataclasses import dataclass
 from enum import Enum
 
+import geodesic_kernel
+
 # Constants for the Earth's ellipsoid model with maximum precision settings
 GEODESIC = Geodesic.WGS84
 
+# Output masks requesting only the quantities the callers read; GeographicLib
+# skips the reduced length, geodesic scale and area series for the rest
+OUT_LATLON = Geodesic.LATITUDE | Geodesic.LONGITUDE
+OUT_LATLON_AZIMUTH = OUT_LATLON | Geodesic.AZIMUTH
+OUT_DISTANCE_AZIMUTH = Geodesic.DISTANCE | Geodesic.AZIMUTH
+# Capabilities of radial lines: positions by distance, returning lat/lon/azimuth
+RADIAL_LINE_CAPS = OUT_LATLON_AZIMUTH | Geodesic.DISTANCE_IN
+
+# pyproj wraps the C implementation of GeographicLib; when it is installed the
+# direct and inverse problems of target-coordinate calculation, validation and
+# the intersection search run there instead of in Python
+PYPROJ_AVAILABLE = importlib.util.find_spec("pyproj") is not None
+
+if PYPROJ_AVAILABLE:
+    from pyproj import Geod
+    _GEOD = Geod(ellps='WGS84')
+
+    def direct_lat_lon(lat1: float, lon1: float, azimuth: float, distance_m: float) -> Tuple[float, float]:
+        """Solve the direct problem; returns (lat2, lon2) in degrees."""
+        lon2, lat2, _ = _GEOD.fwd(lon1, lat1, azimuth, distance_m)
+        return lat2, lon2
+
+    def inverse_distance_azimuth(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+        """Solve the inverse problem; returns (distance in meters, azimuth at the first point)."""
+        azi1, _, distance_m = _GEOD.inv(lon1, lat1, lon2, lat2)
+        return distance_m, azi1
+else:
+    def direct_lat_lon(lat1: float, lon1: float, azimuth: float, distance_m: float) -> Tuple[float, float]:
+        """Solve the direct problem; returns (lat2, lon2) in degrees."""
+        result = GEODESIC.Direct(lat1, lon1, azimuth, distance_m, OUT_LATLON)
+        return result['lat2'], result['lon2']
+
+    def inverse_distance_azimuth(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+        """Solve the inverse problem; returns (distance in meters, azimuth at the first point)."""
+        result = GEODESIC.Inverse(lat1, lon1, lat2, lon2, OUT_DISTANCE_AZIMUTH)
+        return result['s12'], result['azi1']
+
 # Ultra high precision settings for intersection calculations
 MAX_ITERATIONS = 200  # Increased max iterations for better convergence with tight tolerance
 DISTANCE_TOLERANCE_NM = 0.00000054  # About 1 meter in nautical miles (1/1852)
@@ -21,7 +68,47 @@ ANGLE_TOLERANCE_DEG = 0.0001  # Extremely precise angular tolerance (about 0.36
 # Enhanced precision constants for improved accuracy
 NEWTON_RAPHSON_TOLERANCE_M = 0.1  # Even tighter tolerance for Newton-Raphson
 GRADIENT_STEP_SIZE = 0.001  # Small step size for numerical gradient calculation
+NEWTON_MAX_ITERATIONS = 20  # Newton converges quadratically; more steps mean it will not converge
+KERNEL_NEWTON_TOLERANCE_M = 0.001  # Vincenty pre-solve target; leaves one geographiclib check
+NEWTON_MIN_DERIVATIVE = 1e-6  # |d(distance)/ds| below this means the radial is tangent to the DME circle
 MIN_SEARCH_RANGE_NM = 0.000001  # Minimum search range to prevent infinite loops
+INTERSECTION_CACHE_SIZE = 1024  # Memoized intersection solutions
+TARGET_COORDS_CACHE_SIZE = 4096  # Memoized target-coordinate solutions
+# Trial distances per pass of the bracketing search; bisection unless a
+# vectorized geodesic backend makes evaluating many points nearly as cheap as one
+SEARCH_FAN_POINTS = 16 if (PYPROJ_AVAILABLE or geodesic_kernel.NUMBA_AVAILABLE) else 1
+VINCENTY_THRESHOLD_NM = 300.0  # Below this target coordinates use the Vincenty direct kernel
+
+# Display format for calculation timestamps
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Maximum number of calculations kept in the history
+HISTORY_MAXLEN = 1000
+
+# Number of history rows inserted into the history window per scroll step
+HISTORY_CHUNK_SIZE = 200
+
+# Identifier indexes of NAV/FIX files are cached as plain text in an app-owned
+# directory, never next to the data file
+INDEX_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vor_fix_calculation", "indexes")
+INDEX_CACHE_VERSION = 4  # Bump when the index file layout changes
+
+# Declinations are cached per grid cell and day; ~100 m cells keep the snapping error below 0.01°
+DECLINATION_GRID_DEG = 0.001
+DECLINATION_CACHE_SIZE = 4096
+
+# Parsed coordinate strings kept so unchanged entries are not re-parsed
+COORDINATE_PARSE_CACHE_SIZE = 256
+
+# Mean Earth radius (IUGG), used only for spherical first guesses
+EARTH_MEAN_RADIUS_M = 6371008.8
+
+# FIX-DME separations up to which a local flat-earth (cheap ruler) first guess is used
+LOCAL_ESTIMATE_MAX_NM = 60.0
+
+# WGS84 first eccentricity squared and metres per degree of the equatorial radius
+WGS84_E2 = geodesic_kernel.WGS84_F * (2 - geodesic_kernel.WGS84_F)
+METERS_PER_DEGREE = geodesic_kernel.WGS84_A * math.pi / 180.0
 
 # Meters per nautical mile, defined exactly (constant should never be modified)
 METERS_PER_NM = 1852.0
@@ -34,6 +121,12 @@ def _validate_constants():
 # Validate constants on import
 _validate_constants()
 
+# Radius letter designators: 'A' below 1.5 NM, then one letter per NM band
+# centred on whole NM values, up to 'Z' from 25.5 NM onwards
+RADIUS_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+RADIUS_LETTERS_ARRAY = np.array(list(RADIUS_LETTERS))
+RADIUS_LETTER_EDGES_NM = np.arange(1.5, 26.0, 1.0)
+
 # Operation codes
 OPERATION_CODES = {
     "Departure": "4464713",
@@ -60,6 +153,9 @@ FIX_USAGE_CODES = {
     "Missed approach point fix": "M"
 }
 
+# NAV record types that carry a DME
+DME_NAV_TYPES = frozenset(('12', '13'))
+
 # NAV type descriptions
 NAV_TYPE_DESCRIPTIONS = {
     '3': "VOR",
@@ -79,6 +175,12 @@ class FileType(Enum):
     NAV = "NAV"
     FIX = "FIX"
 
+# Column holding the identifier in each data file type
+IDENTIFIER_COLUMNS = {FileType.NAV: 7, FileType.FIX: 2}
+
+# (latitude, longitude) columns in each data file type
+COORDINATE_COLUMNS = {FileType.NAV: (1, 2), FileType.FIX: (0, 1)}
+
 class BearingMode(Enum):
     MAGNETIC = "Magnetic"
     TRUE = "True"
@@ -100,24 +202,229 @@ class Coordinates:
             raise ValueError(f"Longitude {self.lon} out of range [-180, 180]")
     
     def __str__(self) -> str:
-        return f"{self.lat:.9f} {self.lon:.9f}"
+        return "%.9f %.9f" % (self.lat, self.lon)
+    
+    @classmethod
+    def format_batch(cls, latitudes: np.ndarray, longitudes: np.ndarray) -> List[str]:
+        """Format many coordinate pairs exactly as __str__ does, without building instances."""
+        lats = np.asarray(latitudes, dtype=np.float64).ravel().tolist()
+        lons = np.asarray(longitudes, dtype=np.float64).ravel().tolist()
+        return ["%.9f %.9f" % pair for pair in zip(lats, lons)]
+
+@dataclass(frozen=True)
+class IntersectionResult:
+    """Result of a radial/DME intersection search.
+    
+    Frozen only shallowly: coordinates is a mutable Coordinates, so results
+    are never shared between callers (the solver cache stores plain floats).
+    """
+    __slots__ = ("coordinates", "radial_distance_nm", "residual_m")
+    coordinates: Coordinates  # Intersection point on the radial
+    radial_distance_nm: float  # Distance from the FIX along the radial
+    residual_m: float  # Remaining error of the point's distance from the DME
 
 @dataclass
 class CalculationResult:
     """Represents the result of a coordinate calculation."""
     coordinates: Coordinates
     output_string: str
-    timestamp: str
+    timestamp: float  # Seconds since the epoch, as returned by time.time()
     mode: AppMode
+    
+    @property
+    def formatted_timestamp(self) -> str:
+        """Local time of the calculation as shown to the user."""
+        return time.strftime(TIMESTAMP_FORMAT, time.localtime(self.timestamp))
+
+@dataclass
+class WaypointInputs:
+    """Validated, normalized inputs for a waypoint calculation."""
+    __slots__ = ("coordinates", "bearing", "distance_nm", "airport_code", "vor_identifier")
+    coordinates: Coordinates
+    bearing: float
+    distance_nm: float
+    airport_code: str
+    vor_identifier: str
+
+class CalculationHistory:
+    """Columnar (structure-of-arrays) store for calculation results.
+    
+    Target coordinates and epoch timestamps are kept in contiguous float64
+    columns so bulk operations such as export work on whole arrays; the
+    text fields are held in parallel lists. Display rows are formatted on
+    first use and cached.
+    
+    At most maxlen entries are kept: once full, the columns act as a ring
+    buffer and each append overwrites the oldest entry.
+    """
+    
+    def __init__(self, initial_capacity: int = 64, maxlen: int = HISTORY_MAXLEN):
+        if maxlen < 1:
+            raise ValueError("History length must be at least 1")
+        self.maxlen = maxlen
+        capacity = min(initial_capacity, maxlen)
+        self._lat = np.empty(capacity, dtype=np.float64)
+        self._lon = np.empty(capacity, dtype=np.float64)
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._modes: List[AppMode] = []
+        self._outputs: List[str] = []
+        self._rows: List[Optional[Tuple[str, str, str]]] = []  # (time, mode, output) display rows
+        self._size = 0
+        self._start = 0  # Slot of the oldest entry once the buffer has wrapped
+    
+    def _grow(self) -> None:
+        """Double the capacity of the numeric columns, up to maxlen."""
+        capacity = min(max(1, 2 * len(self._lat)), self.maxlen)
+        for name in ('_lat', '_lon', '_timestamps'):
+            column = np.empty(capacity, dtype=np.float64)
+            column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, column)
+    
+    def _slot(self, index: int) -> int:
+        """Map a logical index (0 = oldest, negatives allowed) to a column slot."""
+        if index < 0:
+            index += self._size
+        if not (0 <= index < self._size):
+            raise IndexError("history index out of range")
+        return (self._start + index) % len(self._lat)
+    
+    def _order(self) -> np.ndarray:
+        """Column slots of all entries, oldest first."""
+        return (np.arange(self._size) + self._start) % len(self._lat)
+    
+    def append(self, result: CalculationResult) -> None:
+        """Add a calculation result, evicting the oldest one when full."""
+        if self._size == len(self._lat) and self._size < self.maxlen:
+            self._grow()
+        if self._size < len(self._lat):
+            slot = self._size
+            self._modes.append(result.mode)
+            self._outputs.append(result.output_string)
+            self._rows.append(None)
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % len(self._lat)
+            self._modes[slot] = result.mode
+            self._outputs[slot] = result.output_string
+            self._rows[slot] = None
+        self._lat[slot] = result.coordinates.lat
+        self._lon[slot] = result.coordinates.lon
+        self._timestamps[slot] = result.timestamp
+    
+    def clear(self) -> None:
+        """Remove all entries (the column buffers are kept for reuse)."""
+        self._modes.clear()
+        self._outputs.clear()
+        self._rows.clear()
+        self._size = 0
+        self._start = 0
+    
+    @property
+    def latitudes(self) -> np.ndarray:
+        """Latitude column, oldest entry first (a view until the buffer wraps)."""
+        if self._start == 0:
+            return self._lat[:self._size]
+        return self._lat[self._order()]
+    
+    @property
+    def longitudes(self) -> np.ndarray:
+        """Longitude column, oldest entry first (a view until the buffer wraps)."""
+        if self._start == 0:
+            return self._lon[:self._size]
+        return self._lon[self._order()]
+    
+    def display_row(self, index: int) -> Tuple[str, str, str]:
+        """Return the (time, mode, output) row shown in the history window."""
+        slot = self._slot(index)
+        row = self._rows[slot]
+        if row is None:
+            row = (
+                time.strftime(TIMESTAMP_FORMAT, time.localtime(self._timestamps[slot])),
+                self._modes[slot].value,
+                self._outputs[slot]
+            )
+            self._rows[slot] = row
+        return row
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, index: int) -> CalculationResult:
+        slot = self._slot(index)
+        return CalculationResult(
+            coordinates=Coordinates(float(self._lat[slot]), float(self._lon[slot])),
+            output_string=self._outputs[slot],
+            timestamp=float(self._timestamps[slot]),
+            mode=self._modes[slot]
+        )
+    
+    def __iter__(self):
+        for index in range(self._size):
+            yield self[index]
+    
+    def __reversed__(self):
+        for index in range(self._size - 1, -1, -1):
+            yield self[index]
+    
+    def export_csv(self, path: str) -> None:
+        """Write the history to a CSV file, oldest entry first."""
+        rows = np.empty((self._size, 5), dtype=object)
+        rows[:, 0] = [self.display_row(index)[0] for index in range(self._size)]
+        rows[:, 1] = [self._modes[slot].value for slot in self._order()]
+        rows[:, 2] = self.latitudes
+        rows[:, 3] = self.longitudes
+        rows[:, 4] = [self._outputs[slot] for slot in self._order()]
+        np.savetxt(
+            path, rows, fmt=['%s', '%s', '%.9f', '%.9f', '%s'], delimiter=",",
+            header="timestamp,mode,lat,lon,output", comments=""
+        )
 
 class MagneticDeclinationService:
     """Service for calculating magnetic declination."""
     
-    def __init__(self):
-        self._initialize_geomag()
+    def __init__(self, initialize: bool = True):
+        self.pygeomag_available = False
+        self.geomag_initialized = False
+        self._ready = threading.Event()
+        # Set by whichever of the constructor, initialize_async or the first lookup loads the model
+        self._load_started = False
+        self._load_lock = threading.Lock()
+        self._grid_declination = functools.lru_cache(maxsize=DECLINATION_CACHE_SIZE)(
+            self._calculate_grid_declination
+        )
+        if initialize:
+            self._wait_until_ready()
+    
+    def initialize_async(self) -> threading.Thread:
+        """Load the GeoMag model on a daemon thread; lookups wait until it is ready."""
+        thread = threading.Thread(target=self._wait_until_ready, daemon=True)
+        thread.start()
+        return thread
+    
+    def _wait_until_ready(self) -> None:
+        """Load the GeoMag model unless another caller already is, then wait for it.
+        
+        Without initialize=True or initialize_async(), the first lookup loads it.
+        """
+        if self._ready.is_set():
+            return
+        with self._load_lock:
+            load_here = not self._load_started
+            self._load_started = True
+        if load_here:
+            self._initialize_geomag()
+        self._ready.wait()
     
     def _initialize_geomag(self) -> None:
         """Initialize the GeoMag library if available."""
+        try:
+            self._load_geomag()
+        finally:
+            self._ready.set()
+    
+    def _load_geomag(self) -> None:
+        """Import pygeomag and load its model, preferring high resolution."""
         try:
             spec = importlib.util.find_spec("pygeomag")
             if spec is not None:
@@ -143,13 +450,33 @@ class MagneticDeclinationService:
     
     def get_declination(self, coordinates: Coordinates, altitude_m: float = 0.0, date: Optional[datetime.datetime] = None) -> float:
         """Calculate magnetic declination at the given coordinates with enhanced precision."""
+        self._wait_until_ready()
         if not (self.pygeomag_available and self.geomag_initialized):
             return 0.0
         
+        if date is not None:
+            return self._calculate_declination(coordinates.lat, coordinates.lon, altitude_m, date)
+        
+        # Current-date lookups snap to the grid so repeated calculations reuse the model result
+        return self._grid_declination(
+            round(coordinates.lat / DECLINATION_GRID_DEG),
+            round(coordinates.lon / DECLINATION_GRID_DEG),
+            altitude_m,
+            datetime.date.today().toordinal()
+        )
+    
+    def _calculate_grid_declination(self, lat_cell: int, lon_cell: int, altitude_m: float, day: int) -> float:
+        """Declination at a grid cell centre at the start of the given day (cached per instance)."""
+        return self._calculate_declination(
+            lat_cell * DECLINATION_GRID_DEG,
+            lon_cell * DECLINATION_GRID_DEG,
+            altitude_m,
+            datetime.datetime.fromordinal(day)
+        )
+    
+    def _calculate_declination(self, lat: float, lon: float, altitude_m: float, target_date: datetime.datetime) -> float:
+        """Evaluate the GeoMag model at a point and date."""
         try:
-            # Use provided date or current date
-            target_date = date or datetime.datetime.today()
-            
             # Calculate decimal year with high precision
             year_start = datetime.datetime(target_date.year, 1, 1)
             year_end = datetime.datetime(target_date.year + 1, 1, 1)
@@ -161,8 +488,8 @@ class MagneticDeclinationService:
             altitude_km = altitude_m / 1000.0
             
             result = self.geo_mag.calculate(
-                glat=coordinates.lat, 
-                glon=coordinates.lon, 
+                glat=lat, 
+                glon=lon, 
                 alt=altitude_km, 
                 time=decimal_year
             )
@@ -175,6 +502,7 @@ class MagneticDeclinationService:
     
     def get_enhanced_declination_info(self, coordinates: Coordinates, altitude_m: float = 0.0) -> Dict[str, float]:
         """Get comprehensive magnetic declination information."""
+        self._wait_until_ready()
         if not (self.pygeomag_available and self.geomag_initialized):
             return {'declination': 0.0, 'inclination': 0.0, 'horizontal_intensity': 0.0, 'total_intensity': 0.0}
         
@@ -219,90 +547,560 @@ class CoordinateCalculator:
         """Convert nautical miles to meters with high precision."""
         return nm * METERS_PER_NM
 
+    @staticmethod
+    def normalize_bearing(bearing: float) -> float:
+        """Normalize a bearing into the [0, 360) degree range."""
+        x = math.fmod(bearing, 360.0)
+        return x + 360.0 if x < 0 else x
+
+    @staticmethod
+    def angle_difference(a: float, b: float) -> float:
+        """Smallest angle in degrees between two bearings, in any range."""
+        diff = abs(a - b) % 360.0
+        return 360.0 - diff if diff > 180.0 else diff
+
     @staticmethod
     def calculate_target_coords_geodesic(
         start_coords: Coordinates, 
         azimuth: float, 
         distance_nm: float
     ) -> Coordinates:
-        """Calculate target coordinates with ultra-high precision and adaptive refinement."""
+        """Calculate target coordinates by solving the direct geodesic problem.
+        
+        Typical VOR/DME distances are solved with the Vincenty direct kernel
+        (Numba-compiled when available), which agrees with geographiclib to
+        within micrometres there. Longer distances use GeographicLib's Direct
+        (its C build via pyproj when installed), which is accurate to
+        nanometres on the ellipsoid, so neither result needs a round-trip
+        Inverse check.
+        
+        Results are memoized on the inputs rounded to 9 decimals, so repeated
+        start point, azimuth and distance combinations skip the solve.
+        """
+        return Coordinates(*CoordinateCalculator._cached_target_lat_lon(
+            round(start_coords.lat, 9), round(start_coords.lon, 9), round(azimuth, 9), round(distance_nm, 9)
+        ))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=TARGET_COORDS_CACHE_SIZE)
+    def _cached_target_lat_lon(lat: float, lon: float, azimuth: float, distance_nm: float) -> Tuple[float, float]:
+        """Memoized direct solve on rounded inputs; returns (lat2, lon2)."""
         distance_m = CoordinateCalculator.nm_to_meters(distance_nm)
         
-        # Use high-precision direct calculation
-        result = GEODESIC.Direct(start_coords.lat, start_coords.lon, azimuth, distance_m)
-        initial_coords = Coordinates(result['lat2'], result['lon2'])
+        if distance_nm < VINCENTY_THRESHOLD_NM:
+            lat2, lon2, _ = geodesic_kernel.vincenty_direct(lat, lon, azimuth, distance_m)
+            return lat2, lon2
         
-        # Verify the calculation with inverse calculation
-        verification = GEODESIC.Inverse(
-            start_coords.lat, start_coords.lon, 
-            result['lat2'], result['lon2']
+        return direct_lat_lon(lat, lon, azimuth, distance_m)
+
+    @staticmethod
+    def calculate_target_coords_batch(
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        azimuths: np.ndarray,
+        distances_nm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Project many start points at once; returns (lat, lon) arrays.
+        
+        Uses the Vincenty kernels in geodesic_kernel, which are compiled with
+        Numba when it is installed. Inputs broadcast against each other.
+        """
+        distances_m = np.asarray(distances_nm, dtype=np.float64) * METERS_PER_NM
+        lat2, lon2, _ = geodesic_kernel.direct(latitudes, longitudes, azimuths, distances_m)
+        return lat2, lon2
+
+    @staticmethod
+    def geodesic_line(start_coords: Coordinates, azimuth: float, caps: int = RADIAL_LINE_CAPS):
+        """Create a geodesic line from a start point along an azimuth.
+        
+        Positions along a fixed radial are much cheaper to evaluate on a
+        line object than with repeated Direct calls from the same origin.
+        The default caps support Position calls returning latitude, longitude
+        and azimuth only, so the line skips the unused series coefficients.
+        """
+        return GEODESIC.Line(start_coords.lat, start_coords.lon, azimuth, caps)
+
+    @staticmethod
+    def find_radial_distance_intersection(
+        fix_coords: Coordinates, 
+        true_bearing: float, 
+        dme_coords: Coordinates, 
+        distance_nm: float
+    ) -> IntersectionResult:
+        """Find where a radial from a FIX meets a distance circle around a DME.
+        
+        The result holds the intersection point, its distance (NM) along the
+        radial and the remaining error (meters) of its distance from the DME.
+        The point is on the radial by construction, so no separate
+        verification is needed.
+        
+        Results are memoized on the inputs rounded to 1e-9 degree
+        (coordinates) and 1e-6 (bearing, distance), so repeating a calculation
+        while other fields change costs a dictionary lookup. The cache holds
+        plain floats; every call gets its own Coordinates and result.
+        """
+        lat, lon, radial_distance_nm, residual_m = CoordinateCalculator._cached_radial_distance_intersection(
+            round(fix_coords.lat, 9), round(fix_coords.lon, 9), round(true_bearing, 6),
+            round(dme_coords.lat, 9), round(dme_coords.lon, 9), round(distance_nm, 6)
         )
-        actual_distance_m = verification['s12']
-        distance_error_m = abs(actual_distance_m - distance_m)
-        
-        # If error is acceptable, return immediately
-        if distance_error_m <= DISTANCE_TOLERANCE_M:
-            return initial_coords
+        return IntersectionResult(Coordinates(lat, lon), radial_distance_nm, residual_m)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=INTERSECTION_CACHE_SIZE)
+    def _cached_radial_distance_intersection(
+        fix_lat: float,
+        fix_lon: float,
+        true_bearing: float,
+        dme_lat: float,
+        dme_lon: float,
+        distance_nm: float
+    ) -> Tuple[float, float, float, float]:
+        """Memoized solve on quantized inputs; returns (lat, lon, radial_distance_nm, residual_m)."""
+        result = CoordinateCalculator._solve_radial_distance_intersection(
+            Coordinates(fix_lat, fix_lon), true_bearing, Coordinates(dme_lat, dme_lon), distance_nm
+        )
+        return result.coordinates.lat, result.coordinates.lon, result.radial_distance_nm, result.residual_m
+
+    @staticmethod
+    def _solve_radial_distance_intersection(
+        fix_coords: Coordinates, 
+        true_bearing: float, 
+        dme_coords: Coordinates, 
+        distance_nm: float
+    ) -> IntersectionResult:
+        """Run the Newton iteration with bracketing fallback (uncached)."""
+        distance_m = CoordinateCalculator.nm_to_meters(distance_nm)
         
-        # For distances with higher error, use adaptive multi-step approach
-        optimal_coords = initial_coords
-        min_error = distance_error_m
+        # Every trial point lies on the same radial, so build its geodesic once
+        radial_line = CoordinateCalculator.geodesic_line(fix_coords, true_bearing)
         
-        # Try different step sizes to find optimal accuracy
-        step_sizes = [100, 250, 500, 1000]  # Different step sizes in km
+        initial_distance_nm = CoordinateCalculator._local_radial_distance_estimate_nm(
+            fix_coords, true_bearing, dme_coords, distance_m
+        )
         
-        for step_size_km in step_sizes:
-            if distance_nm < step_size_km / 1.852:  # Convert km to nm
-                continue  # Skip if distance is smaller than step size
-                
-            num_steps = max(2, int(distance_nm * 1.852 / step_size_km))
-            step_coords = start_coords
-            step_distance = distance_m / num_steps
-            
-            # Multi-step calculation with verification at each step
-            for step in range(num_steps):
-                step_result = GEODESIC.Direct(
-                    step_coords.lat, step_coords.lon, azimuth, step_distance
+        # Otherwise the FIX-DME geodesic seeds the estimate and the search range; solve it once
+        fix_dme_distance_m = None
+        if initial_distance_nm is None:
+            fix_dme_distance_m, bearing_to_dme = inverse_distance_azimuth(
+                fix_coords.lat, fix_coords.lon, dme_coords.lat, dme_coords.lon
+            )
+            initial_distance_nm = CoordinateCalculator._estimate_radial_distance_nm(
+                fix_dme_distance_m, bearing_to_dme, true_bearing, distance_m
+            )
+            if initial_distance_nm is None:
+                # The radial misses the circle or only touches it; settle it without searching
+                result = CoordinateCalculator._closest_radial_point_intersection(
+                    radial_line, dme_coords, distance_m, fix_dme_distance_m, bearing_to_dme, true_bearing
                 )
-                step_coords = Coordinates(step_result['lat2'], step_result['lon2'])
+                if result is not None:
+                    return result
+        
+        if initial_distance_nm is not None:
+            # Converge with the (Numba-compiled when available) Vincenty kernels first;
+            # the geographiclib Newton pass then normally only confirms the result
+            refined_m = geodesic_kernel.radial_intersection_distance(
+                fix_coords.lat, fix_coords.lon, true_bearing, dme_coords.lat, dme_coords.lon,
+                distance_m, initial_distance_nm * METERS_PER_NM, KERNEL_NEWTON_TOLERANCE_M, NEWTON_MAX_ITERATIONS
+            )
+            if not math.isnan(refined_m):
+                initial_distance_nm = refined_m / METERS_PER_NM
             
-            # Final verification for this approach
-            final_verification = GEODESIC.Inverse(
-                start_coords.lat, start_coords.lon,
-                step_coords.lat, step_coords.lon
+            try:
+                result = CoordinateCalculator._newton_raphson_intersection(
+                    radial_line, dme_coords, distance_m, initial_distance_nm
+                )
+                if result is not None:
+                    return result
+            except Exception:
+                pass  # Fall back to binary search if the Newton iteration fails
+        
+        # Enhanced binary search with adaptive refinement
+        return CoordinateCalculator._enhanced_binary_search_intersection(
+            fix_coords, dme_coords, distance_m, radial_line, fix_dme_distance_m
+        )
+
+    @staticmethod
+    def find_radial_distance_intersections_batch(
+        fix_lats: np.ndarray,
+        fix_lons: np.ndarray,
+        true_bearings: np.ndarray,
+        dme_lats: np.ndarray,
+        dme_lons: np.ndarray,
+        distances_nm: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Solve many radial/DME intersections in lock-step.
+        
+        Returns (lat, lon, radial distance NM, residual m) arrays; entries with
+        no solution, or whose Newton iteration does not converge, are NaN.
+        Every iteration makes one direct and one inverse call over all
+        unconverged entries using the Vincenty kernels in geodesic_kernel.
+        Inputs broadcast against each other.
+        """
+        (fix_lats, fix_lons, true_bearings, dme_lats, dme_lons, distances_nm), shape = \
+            geodesic_kernel._as_columns(fix_lats, fix_lons, true_bearings, dme_lats, dme_lons, distances_nm)
+        distances_m = distances_nm * METERS_PER_NM
+        
+        # Spherical-triangle starting guesses, as in _estimate_radial_distance_nm
+        fix_dme_m, bearing_to_dme, _ = geodesic_kernel.inverse(fix_lats, fix_lons, dme_lats, dme_lons)
+        cos_angle = np.cos(np.radians(true_bearings - bearing_to_dme))
+        b = fix_dme_m / EARTH_MEAN_RADIUS_M
+        amplitude = np.hypot(np.cos(b), np.sin(b) * cos_angle)
+        phase = np.arctan2(np.sin(b) * cos_angle, np.cos(b))
+        with np.errstate(invalid='ignore'):
+            offset = np.arccos(np.cos(distances_m / EARTH_MEAN_RADIUS_M) / amplitude)
+        near = (phase - offset) * EARTH_MEAN_RADIUS_M
+        far = (phase + offset) * EARTH_MEAN_RADIUS_M
+        radial_m = np.maximum(0.0, np.where(np.minimum(near, far) > 0, np.minimum(near, far), np.maximum(near, far)))
+        radial_m = np.where(fix_dme_m == 0, distances_m, radial_m)
+        
+        lats = np.full_like(radial_m, np.nan)
+        lons = np.full_like(radial_m, np.nan)
+        residuals_m = np.full_like(radial_m, np.nan)
+        solved_m = np.full_like(radial_m, np.nan)
+        active = np.flatnonzero(~np.isnan(radial_m))
+        
+        for iteration in range(NEWTON_MAX_ITERATIONS):
+            if active.size == 0:
+                break
+            s = radial_m[active]
+            point_lats, point_lons, radial_azimuths = geodesic_kernel.direct(
+                fix_lats[active], fix_lons[active], true_bearings[active], s
             )
-            final_distance_error = abs(final_verification['s12'] - distance_m)
+            to_dme_m, azimuths_to_dme, _ = geodesic_kernel.inverse(
+                point_lats, point_lons, dme_lats[active], dme_lons[active]
+            )
+            errors_m = to_dme_m - distances_m[active]
+            
+            done = np.abs(errors_m) < NEWTON_RAPHSON_TOLERANCE_M
+            finished = active[done]
+            lats[finished] = point_lats[done]
+            lons[finished] = point_lons[done]
+            residuals_m[finished] = np.abs(errors_m[done])
+            solved_m[finished] = s[done]
+            
+            derivatives = -np.cos(np.radians(azimuths_to_dme - radial_azimuths))
+            # Converged entries and near-tangent geometry drop out of the iteration
+            keep = ~done & (np.abs(derivatives) >= NEWTON_MIN_DERIVATIVE)
+            active = active[keep]
+            radial_m[active] = np.abs(s[keep] - errors_m[keep] / derivatives[keep])
+        
+        return (lats.reshape(shape), lons.reshape(shape),
+                (solved_m / METERS_PER_NM).reshape(shape), residuals_m.reshape(shape))
+
+    @staticmethod
+    def _local_radial_distance_estimate_nm(
+        fix_coords: Coordinates, 
+        true_bearing: float, 
+        dme_coords: Coordinates, 
+        distance_m: float
+    ) -> Optional[float]:
+        """Estimate the radial distance in a local flat frame around the FIX.
+        
+        Uses the WGS84 "cheap ruler" scale factors at the mid latitude, so no
+        geodesic problem is solved; the result is typically within tens of
+        metres, which the Newton iteration removes in a step or two. Returns
+        None when the DME is too far away for the approximation or the radial
+        misses the circle in the flat frame.
+        """
+        cos_lat = math.cos(math.radians((fix_coords.lat + dme_coords.lat) / 2))
+        w2 = 1 / (1 - WGS84_E2 * (1 - cos_lat * cos_lat))
+        w = math.sqrt(w2)
+        kx = METERS_PER_DEGREE * w * cos_lat
+        ky = METERS_PER_DEGREE * w * w2 * (1 - WGS84_E2)
+        
+        dx = ((dme_coords.lon - fix_coords.lon + 540.0) % 360.0 - 180.0) * kx
+        dy = (dme_coords.lat - fix_coords.lat) * ky
+        fix_dme_m_sq = dx * dx + dy * dy
+        if fix_dme_m_sq > (LOCAL_ESTIMATE_MAX_NM * METERS_PER_NM) ** 2:
+            return None
+        
+        # Points s * (sin, cos)(bearing) on the radial at distance_m from the DME
+        bearing_rad = math.radians(true_bearing)
+        along = dx * math.sin(bearing_rad) + dy * math.cos(bearing_rad)
+        discriminant = along * along - fix_dme_m_sq + distance_m * distance_m
+        if discriminant < 0:
+            return None
+        
+        root = math.sqrt(discriminant)
+        near, far = along - root, along + root
+        return CoordinateCalculator.meters_to_nm(max(0.0, near if near > 0 else far))
+
+    @staticmethod
+    def _estimate_radial_distance_nm(
+        fix_dme_distance_m: float, 
+        bearing_to_dme: float, 
+        true_bearing: float, 
+        distance_m: float
+    ) -> Optional[float]:
+        """Estimate the distance along the radial to the DME circle, or None if there is none.
+        
+        Solves the spherical triangle FIX-P-DME for the side x along the
+        radial: cos(c) = cos(b)cos(x) + sin(b)sin(x)cos(A), with b the FIX-DME
+        side, c the DME distance and A the angle at the FIX. Fed with the
+        ellipsoidal FIX-DME distance and azimuth, this is typically within a
+        few millimetres of the final answer at terminal-area ranges.
+        """
+        # Geometric solution for initial guess
+        if fix_dme_distance_m == 0:
+            return CoordinateCalculator.meters_to_nm(distance_m)
+        
+        angle_rad = math.radians(CoordinateCalculator.angle_difference(true_bearing, bearing_to_dme))
+        b = fix_dme_distance_m / EARTH_MEAN_RADIUS_M
+        c = distance_m / EARTH_MEAN_RADIUS_M
+        
+        # Write the right-hand side as amplitude * cos(x - phase) and solve for x
+        amplitude = math.hypot(math.cos(b), math.sin(b) * math.cos(angle_rad))
+        ratio = math.cos(c) / amplitude
+        if abs(ratio) > 1:
+            return None  # No real solution
+        
+        phase = math.atan2(math.sin(b) * math.cos(angle_rad), math.cos(b))
+        offset = math.acos(ratio)
+        distance1 = (phase - offset) * EARTH_MEAN_RADIUS_M
+        distance2 = (phase + offset) * EARTH_MEAN_RADIUS_M
+        
+        # Choose the positive solution closest to expected range
+        initial_distance_m = max(0, min(distance1, distance2) if min(distance1, distance2) > 0 else max(distance1, distance2))
+        return CoordinateCalculator.meters_to_nm(initial_distance_m)
+
+    @staticmethod
+    def _closest_radial_point_intersection(
+        radial_line, 
+        dme_coords: Coordinates, 
+        distance_m: float,
+        fix_dme_distance_m: float, 
+        bearing_to_dme: float, 
+        true_bearing: float
+    ) -> Optional[IntersectionResult]:
+        """Answer with the point of the radial closest to the DME when the circle does not cross it.
+        
+        On the sphere the foot of the perpendicular from the DME lies at the
+        along-track distance atan2(sin(b)cos(A), cos(b)) from the FIX (the
+        phase used by _estimate_radial_distance_nm), clamped to the start of
+        the radial. One Position and one Inverse give its actual distance
+        from the DME: if that is no closer than the DME distance (within
+        DISTANCE_TOLERANCE_M), the point is the tangent solution or the best
+        approximation and is returned with its residual. Otherwise the
+        ellipsoid does reach the circle where the sphere does not, and None
+        sends the caller on to the bracketing search.
+        """
+        angle_rad = math.radians(CoordinateCalculator.angle_difference(true_bearing, bearing_to_dme))
+        b = fix_dme_distance_m / EARTH_MEAN_RADIUS_M
+        along_m = max(0.0, math.atan2(math.sin(b) * math.cos(angle_rad), math.cos(b)) * EARTH_MEAN_RADIUS_M)
+        
+        point = radial_line.Position(along_m, OUT_LATLON)
+        to_dme_m, _ = inverse_distance_azimuth(point['lat2'], point['lon2'], dme_coords.lat, dme_coords.lon)
+        error_m = to_dme_m - distance_m
+        if error_m < -DISTANCE_TOLERANCE_M:
+            return None
+        return IntersectionResult(Coordinates(point['lat2'], point['lon2']), along_m / METERS_PER_NM, abs(error_m))
+
+    @staticmethod
+    def _newton_raphson_intersection(
+        radial_line, 
+        dme_coords: Coordinates, 
+        distance_m: float,
+        initial_distance_nm: float
+    ) -> Optional[IntersectionResult]:
+        """Refine the radial distance with Newton steps using the geodesic derivative.
+        
+        For f(s) = dist(P(s), DME) - D, moving along the radial changes the
+        distance to the DME at the rate -cos(azimuth to the DME minus radial
+        azimuth at P), both of which Position and Inverse already return. Each
+        iteration therefore costs one Position and one Inverse. Returns None
+        when the radial is near tangent to the circle so the caller can fall
+        back to bisection.
+        """
+        dme_lat, dme_lon = dme_coords.lat, dme_coords.lon
+        # Iterate in meters and bind the per-iteration callables locally
+        current_m = initial_distance_nm * METERS_PER_NM
+        position = radial_line.Position
+        inverse = inverse_distance_azimuth
+        cos, radians = math.cos, math.radians
+        
+        for iteration in range(NEWTON_MAX_ITERATIONS):
+            point = position(current_m, OUT_LATLON_AZIMUTH)
+            to_dme_m, azimuth_to_dme = inverse(point['lat2'], point['lon2'], dme_lat, dme_lon)
+            error_m = to_dme_m - distance_m
+            
+            if -NEWTON_RAPHSON_TOLERANCE_M < error_m < NEWTON_RAPHSON_TOLERANCE_M:
+                return IntersectionResult(
+                    Coordinates(point['lat2'], point['lon2']), current_m / METERS_PER_NM, abs(error_m)
+                )
             
-            # Keep the most accurate result
-            if final_distance_error < min_error:
-                min_error = final_distance_error
-                optimal_coords = step_coords
-                
-                # If we achieved excellent accuracy, stop searching
-                if min_error <= DISTANCE_TOLERANCE_M:
-                    break
+            derivative = -cos(radians(azimuth_to_dme - point['azi2']))
+            if -NEWTON_MIN_DERIVATIVE < derivative < NEWTON_MIN_DERIVATIVE:
+                break  # Near-tangent geometry; Newton steps are unreliable
+            
+            # Prevent negative distances
+            current_m = abs(current_m - error_m / derivative)
+        
+        return None  # Failed to converge
+
+    @staticmethod
+    def _enhanced_binary_search_intersection(
+        fix_coords: Coordinates, 
+        dme_coords: Coordinates, 
+        distance_m: float,
+        radial_line,
+        fix_dme_distance_m: Optional[float] = None
+    ) -> IntersectionResult:
+        """Enhanced bracketing search with adaptive range and precision refinement.
+        
+        Each pass evaluates SEARCH_FAN_POINTS evenly spaced radial distances
+        and keeps the sub-interval bracketing a crossing of the DME distance
+        (or, without one, around the smallest error). With a single point
+        this is plain bisection; with a vectorized geodesic backend the range
+        shrinks by roughly that factor per pass for one array call. As soon as
+        the range ends straddle the target distance, scipy's brentq finishes
+        the search.
+        """
+        # Calculate distance between FIX and DME unless the caller already has it
+        if fix_dme_distance_m is None:
+            fix_dme_distance_m, _ = inverse_distance_azimuth(fix_coords.lat, fix_coords.lon, dme_coords.lat, dme_coords.lon)
+        fix_dme_distance_nm = CoordinateCalculator.meters_to_nm(fix_dme_distance_m)
+        distance_nm = CoordinateCalculator.meters_to_nm(distance_m)
+        
+        # Intelligent search range determination
+        if distance_nm < 0.05:
+            min_dist, max_dist = 0.0, 0.2
+        elif distance_nm < 0.5:
+            min_dist, max_dist = 0.0, max(1.0, distance_nm * 2)
+        else:
+            # Use geometric constraints for better range estimation
+            margin = max(1.0, distance_nm * 0.1)  # Adaptive margin
+            min_dist = max(0.0, abs(fix_dme_distance_nm - distance_nm) - margin)
+            max_dist = fix_dme_distance_nm + distance_nm + margin
+        
+        # Validate and adjust search range
+        if min_dist >= max_dist or (max_dist - min_dist) < MIN_SEARCH_RANGE_NM:
+            min_dist = 0.0
+            max_dist = max(1.0, distance_nm * 2)
+        
+        position = radial_line.Position
+        dme_lat, dme_lon = dme_coords.lat, dme_coords.lon
+        
+        # radial distance -> (lat, lon, signed error) for every scalar evaluation,
+        # so the reported point never needs a second Position or Inverse
+        evaluated: Dict[float, Tuple[float, float, float]] = {}
+        
+        def error_at(radial_nm: float) -> float:
+            point = position(radial_nm * METERS_PER_NM, OUT_LATLON)
+            to_dme_m, _ = inverse_distance_azimuth(point['lat2'], point['lon2'], dme_lat, dme_lon)
+            evaluated[radial_nm] = (point['lat2'], point['lon2'], to_dme_m - distance_m)
+            return to_dme_m - distance_m
         
-        return optimal_coords
+        # Signed errors at the current range ends
+        min_error_m = error_at(min_dist)
+        max_error_m = error_at(max_dist)
+        
+        # Enhanced search with precision tracking
+        best_approx_distance = float('inf')
+        best_approx_radial_nm = 0.0
+        fractions = np.arange(1, SEARCH_FAN_POINTS + 1) / (SEARCH_FAN_POINTS + 1)
+        
+        # Track convergence for adaptive precision
+        last_improvement_pass = 0
+        
+        for search_pass in range(MAX_ITERATIONS):
+            # Once the range brackets a single sign change, Brent's method converges superlinearly
+            if min_error_m * max_error_m < 0:
+                root_nm = brentq(error_at, min_dist, max_dist, xtol=MIN_SEARCH_RANGE_NM, maxiter=MAX_ITERATIONS)
+                root_error_m = abs(evaluated[root_nm][2] if root_nm in evaluated else error_at(root_nm))
+                if root_error_m < best_approx_distance:
+                    best_approx_distance = root_error_m
+                    best_approx_radial_nm = root_nm
+                break
+            
+            test_dists = min_dist + (max_dist - min_dist) * fractions
+            test_errors_m = CoordinateCalculator._radial_distances_to_point(
+                radial_line, test_dists, dme_coords
+            ) - distance_m
+            errors_m = np.abs(test_errors_m)
+            
+            # Track best approximation
+            best = int(np.argmin(errors_m))
+            if errors_m[best] < best_approx_distance:
+                best_approx_distance = float(errors_m[best])
+                best_approx_radial_nm = float(test_dists[best])
+                last_improvement_pass = search_pass
+            
+            # Check for convergence
+            if best_approx_distance < DISTANCE_TOLERANCE_M:
+                break
+            
+            # Adaptive precision: if no improvement for many passes, use current best
+            if search_pass - last_improvement_pass > 20:
+                break
+            
+            # Adjust search range with enhanced logic
+            beyond = test_errors_m > 0
+            if len(test_dists) == 1:
+                if beyond[0]:
+                    max_dist, max_error_m = float(test_dists[0]), float(test_errors_m[0])
+                else:
+                    min_dist, min_error_m = float(test_dists[0]), float(test_errors_m[0])
+            else:
+                crossings = np.flatnonzero(beyond[1:] != beyond[:-1])
+                if crossings.size:
+                    # Bracket the crossing closest to the best point so far
+                    i = int(crossings[np.argmin(np.abs(crossings + 0.5 - best))])
+                    min_dist, min_error_m = float(test_dists[i]), float(test_errors_m[i])
+                    max_dist, max_error_m = float(test_dists[i + 1]), float(test_errors_m[i + 1])
+                else:
+                    # No crossing in this fan: close in on the smallest error
+                    if best > 0:
+                        min_dist, min_error_m = float(test_dists[best - 1]), float(test_errors_m[best - 1])
+                    if best < len(test_dists) - 1:
+                        max_dist, max_error_m = float(test_dists[best + 1]), float(test_errors_m[best + 1])
+            
+            # Enhanced termination condition
+            range_size = max_dist - min_dist
+            if range_size < MIN_SEARCH_RANGE_NM:
+                break
+        
+        # Report the point from the same geodesic line the Newton path uses
+        if best_approx_radial_nm in evaluated:
+            best_lat, best_lon, _ = evaluated[best_approx_radial_nm]
+        else:
+            point = position(best_approx_radial_nm * METERS_PER_NM, OUT_LATLON)
+            best_lat, best_lon = point['lat2'], point['lon2']
+        return IntersectionResult(Coordinates(best_lat, best_lon), best_approx_radial_nm, best_approx_distance)
+
+    @staticmethod
+    def _radial_distances_to_point(radial_line, radial_distances_nm: np.ndarray, target: Coordinates) -> np.ndarray:
+        """Distances (meters) from points along a radial to a target point."""
+        if len(radial_distances_nm) == 1:
+            point = radial_line.Position(radial_distances_nm[0] * METERS_PER_NM, OUT_LATLON)
+            distance_m, _ = inverse_distance_azimuth(point['lat2'], point['lon2'], target.lat, target.lon)
+            return np.array([distance_m])
+        
+        radial_distances_m = radial_distances_nm * METERS_PER_NM
+        if PYPROJ_AVAILABLE:
+            count = len(radial_distances_m)
+            lons, lats, _ = _GEOD.fwd(
+                np.full(count, radial_line.lon1), np.full(count, radial_line.lat1),
+                np.full(count, radial_line.azi1), radial_distances_m
+            )
+            _, _, distances_m = _GEOD.inv(lons, lats, np.full(count, target.lon), np.full(count, target.lat))
+            return np.asarray(distances_m)
+        
+        lats, lons, _ = geodesic_kernel.direct(
+            radial_line.lat1, radial_line.lon1, radial_line.azi1, radial_distances_m
+        )
+        distances_m, _, _ = geodesic_kernel.inverse(lats, lons, target.lat, target.lon)
+        return distances_m
 
     @staticmethod
     def get_radius_letter(distance_nm: float) -> str:
         """Get the single-letter radius designator."""
-        ranges = [
-            (0.1, 1.5, 'A'), (1.5, 2.5, 'B'), (2.5, 3.5, 'C'), (3.5, 4.5, 'D'),
-            (4.5, 5.5, 'E'), (5.5, 6.5, 'F'), (6.5, 7.5, 'G'), (7.5, 8.5, 'H'),
-            (8.5, 9.5, 'I'), (9.5, 10.5, 'J'), (10.5, 11.5, 'K'), (11.5, 12.5, 'L'),
-            (12.5, 13.5, 'M'), (13.5, 14.5, 'N'), (14.5, 15.5, 'O'), (15.5, 16.5, 'P'),
-            (16.5, 17.5, 'Q'), (17.5, 18.5, 'R'), (18.5, 19.5, 'S'), (19.5, 20.5, 'T'),
-            (20.5, 21.5, 'U'), (21.5, 22.5, 'V'), (22.5, 23.5, 'W'), (23.5, 24.5, 'X'),
-            (24.5, 25.5, 'Y'), (25.5, 26.5, 'Z')
-        ]
-        for low, high, letter in ranges:
-            if low <= distance_nm < high:
-                return letter
-        # Handle edge cases
-        if distance_nm < 0.1:
-            return 'A'
-        return 'Z'
+        # Bands are 1 NM wide with edges at n + 0.5, so the index is plain arithmetic
+        return RADIUS_LETTERS[min(len(RADIUS_LETTERS) - 1, max(0, math.floor(distance_nm - 0.5)))]
+
+    @staticmethod
+    def get_radius_letters(distances_nm: np.ndarray) -> np.ndarray:
+        """Get radius designators for an array of distances in one pass."""
+        return RADIUS_LETTERS_ARRAY[np.digitize(distances_nm, RADIUS_LETTER_EDGES_NM)]
 
     @staticmethod
     def validate_calculation_accuracy(
@@ -312,19 +1110,14 @@ class CoordinateCalculator:
         expected_distance_nm: float
     ) -> Dict[str, float]:
         """Validate the accuracy of a coordinate calculation."""
-        result = GEODESIC.Inverse(start_coords.lat, start_coords.lon, end_coords.lat, end_coords.lon)
-        
-        actual_distance_m = result['s12']
+        actual_distance_m, azimuth = inverse_distance_azimuth(
+            start_coords.lat, start_coords.lon, end_coords.lat, end_coords.lon
+        )
         actual_distance_nm = CoordinateCalculator.meters_to_nm(actual_distance_m)
-        actual_azimuth = result['azi1']
-        
-        # Normalize azimuths to 0-360 range
-        actual_azimuth = actual_azimuth % 360
-        expected_azimuth = expected_azimuth % 360
+        actual_azimuth = CoordinateCalculator.normalize_bearing(azimuth)
         
         # Calculate azimuth difference (shortest angular distance)
-        azimuth_diff = abs(actual_azimuth - expected_azimuth)
-        azimuth_diff = min(azimuth_diff, 360 - azimuth_diff)
+        azimuth_diff = CoordinateCalculator.angle_difference(actual_azimuth, expected_azimuth)
         
         distance_error_nm = abs(actual_distance_nm - expected_distance_nm)
         distance_error_m = abs(actual_distance_m - CoordinateCalculator.nm_to_meters(expected_distance_nm))
@@ -338,6 +1131,56 @@ class CoordinateCalculator:
             'accuracy_rating': CoordinateCalculator._calculate_accuracy_rating(distance_error_m, azimuth_diff)
         }
     
+    @staticmethod
+    def validate_calculation_accuracy_batch(
+        start_lats: np.ndarray,
+        start_lons: np.ndarray,
+        end_lats: np.ndarray,
+        end_lons: np.ndarray,
+        expected_azimuths: np.ndarray,
+        expected_distances_nm: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Validate many calculations at once; returns arrays keyed like validate_calculation_accuracy.
+        
+        With pyproj every inverse problem is solved in one C call; otherwise
+        geographiclib solves them one by one, exactly as the single-point
+        version does. Inputs broadcast against each other.
+        """
+        (start_lats, start_lons, end_lats, end_lons, expected_azimuths, expected_distances_nm), shape = \
+            geodesic_kernel._as_columns(start_lats, start_lons, end_lats, end_lons, expected_azimuths, expected_distances_nm)
+        
+        if PYPROJ_AVAILABLE:
+            azimuths, _, distances_m = _GEOD.inv(start_lons, start_lats, end_lons, end_lats)
+            actual_distances_m = np.asarray(distances_m)
+            actual_azimuths = np.asarray(azimuths)
+        else:
+            inverses = [
+                GEODESIC.Inverse(lat1, lon1, lat2, lon2, OUT_DISTANCE_AZIMUTH)
+                for lat1, lon1, lat2, lon2 in zip(start_lats.tolist(), start_lons.tolist(),
+                                                  end_lats.tolist(), end_lons.tolist())
+            ]
+            actual_distances_m = np.array([result['s12'] for result in inverses], dtype=np.float64)
+            actual_azimuths = np.array([result['azi1'] for result in inverses], dtype=np.float64)
+        
+        actual_azimuths = np.mod(actual_azimuths, 360.0)
+        azimuth_diffs = np.abs(actual_azimuths - expected_azimuths) % 360.0
+        azimuth_diffs = np.where(azimuth_diffs > 180.0, 360.0 - azimuth_diffs, azimuth_diffs)
+        actual_distances_nm = actual_distances_m / METERS_PER_NM
+        distance_errors_m = np.abs(actual_distances_m - expected_distances_nm * METERS_PER_NM)
+        ratings = [
+            CoordinateCalculator._calculate_accuracy_rating(distance_error_m, azimuth_diff)
+            for distance_error_m, azimuth_diff in zip(distance_errors_m.tolist(), azimuth_diffs.tolist())
+        ]
+        
+        return {
+            'distance_error_nm': np.abs(actual_distances_nm - expected_distances_nm).reshape(shape),
+            'distance_error_m': distance_errors_m.reshape(shape),
+            'azimuth_error_deg': azimuth_diffs.reshape(shape),
+            'actual_distance_nm': actual_distances_nm.reshape(shape),
+            'actual_azimuth_deg': actual_azimuths.reshape(shape),
+            'accuracy_rating': np.array(ratings).reshape(shape)
+        }
+    
     @staticmethod
     def _calculate_accuracy_rating(distance_error_m: float, azimuth_error_deg: float) -> str:
         """Calculate accuracy rating based on errors."""
@@ -368,39 +1211,74 @@ class CoordinateCalculator:
                 'total_calculations': 0
             }
         
-        distance_errors = []
-        azimuth_errors = []
-        
-        for start_coords, end_coords, expected_azimuth, expected_distance_nm in calculations:
-            metrics = CoordinateCalculator.validate_calculation_accuracy(
-                start_coords, end_coords, expected_azimuth, expected_distance_nm
-            )
-            distance_errors.append(metrics['distance_error_m'])
-            azimuth_errors.append(metrics['azimuth_error_deg'])
+        # Solve all the inverse problems in one batched call, then reduce the arrays
+        start_lats, start_lons, end_lats, end_lons, expected_azimuths, expected_distances_nm = zip(*[
+            (start.lat, start.lon, end.lat, end.lon, azimuth, distance_nm)
+            for start, end, azimuth, distance_nm in calculations
+        ])
+        metrics = CoordinateCalculator.validate_calculation_accuracy_batch(
+            start_lats, start_lons, end_lats, end_lons, expected_azimuths, expected_distances_nm
+        )
+        distance_errors = metrics['distance_error_m']
+        azimuth_errors = metrics['azimuth_error_deg']
         
         return {
-            'mean_distance_error_m': sum(distance_errors) / len(distance_errors),
-            'max_distance_error_m': max(distance_errors),
-            'min_distance_error_m': min(distance_errors),
-            'mean_azimuth_error_deg': sum(azimuth_errors) / len(azimuth_errors),
-            'max_azimuth_error_deg': max(azimuth_errors),
-            'min_azimuth_error_deg': min(azimuth_errors),
+            'mean_distance_error_m': float(distance_errors.mean()),
+            'max_distance_error_m': float(distance_errors.max()),
+            'min_distance_error_m': float(distance_errors.min()),
+            'mean_azimuth_error_deg': float(azimuth_errors.mean()),
+            'max_azimuth_error_deg': float(azimuth_errors.max()),
+            'min_azimuth_error_deg': float(azimuth_errors.min()),
             'total_calculations': len(calculations)
         }
 
+def index_cache_path(file_path: str) -> str:
+    """Path of the cached identifier index for a data file, named by a hash of its absolute path."""
+    digest = hashlib.sha256(os.fsencode(os.path.abspath(file_path))).hexdigest()
+    return os.path.join(INDEX_CACHE_DIR, digest + ".idx")
+
 class NavigationDataService:
     """Service for reading and searching navigation data files."""
     
     def __init__(self):
         self.nav_file_path = ""
         self.fix_file_path = ""
+        # file type -> ((path, mtime_ns, size), identifier -> raw matching lines, as bytes);
+        # without a background build the index is None until the same file is queried twice
+        self._indexes: Dict[FileType, Tuple[Tuple[str, int, int], Optional[Dict[bytes, List[bytes]]]]] = {}
+        # file type -> event set once the background index build for the current path finishes
+        self._index_ready: Dict[FileType, threading.Event] = {}
     
     def set_file_path(self, file_type: FileType, path: str) -> None:
-        """Set the file path for the specified file type."""
+        """Set the file path for the specified file type and start indexing it in the background."""
         if file_type == FileType.NAV:
             self.nav_file_path = path
         else:
             self.fix_file_path = path
+        
+        ready = threading.Event()
+        self._index_ready[file_type] = ready
+        if path:
+            threading.Thread(target=self._preload_index, args=(file_type, path, ready), daemon=True).start()
+        else:
+            ready.set()
+    
+    def _preload_index(self, file_type: FileType, file_path: str, ready: threading.Event) -> None:
+        """Build (or load the cached) index for a newly selected file."""
+        try:
+            stat = os.stat(file_path)
+            key = (file_path, stat.st_mtime_ns, stat.st_size)
+            index = self._read_index_cache(file_path, key)
+            if index is None:
+                index = self._load_index(file_path, IDENTIFIER_COLUMNS[file_type])
+                self._write_index_cache(file_path, key, index)
+            # Drop the result if another file was selected while this one was being read
+            if self._index_ready.get(file_type) is ready:
+                self._indexes[file_type] = (key, index)
+        except Exception:
+            pass  # Errors are reported by search_identifier when the file is queried
+        finally:
+            ready.set()
     
     def search_identifier(
         self, 
@@ -414,29 +1292,152 @@ class NavigationDataService:
         if not file_path:
             raise FileNotFoundError(f"No {file_type.value} file selected")
         
+        ready = self._index_ready.get(file_type)
+        if ready is not None:
+            ready.wait()
+        
+        identifier = identifier.upper()
+        relevant_index = IDENTIFIER_COLUMNS[file_type]
         try:
-            with open(file_path, 'r') as file:
-                matching_lines = []
-                for line in file:
-                    parts = line.strip().split()
-                    relevant_index = 7 if file_type == FileType.NAV else 2
-                    
-                    if (len(parts) > relevant_index and 
-                        parts[relevant_index] == identifier.upper()):
-                        matching_lines.append(parts)
-                
-                return matching_lines
+            stat = os.stat(file_path)
+            key = (file_path, stat.st_mtime_ns, stat.st_size)
+            cached = self._indexes.get(file_type)
+            if cached is None or cached[0] != key:
+                index = self._read_index_cache(file_path, key)
+                self._indexes[file_type] = (key, index)
+                if index is None:
+                    # A one-off lookup is cheaper as a filtered scan than a full index build
+                    return self._scan_file(file_path, relevant_index, identifier)
+            else:
+                index = cached[1]
+            if index is None:
+                index = self._load_index(file_path, relevant_index)
+                self._indexes[file_type] = (key, index)
+                self._write_index_cache(file_path, key, index)
+            return [line.decode(errors='replace').split() for line in index.get(identifier.encode(), ())]
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
         except Exception as e:
             raise Exception(f"Error reading {file_type.value} file: {e}")
+    
+    @staticmethod
+    def _index_cache_header(key: Tuple[str, int, int]) -> bytes:
+        """Header lines of an index file: layout version, data file mtime and size, then its path."""
+        return b"%d %d %d\n%s\n" % (INDEX_CACHE_VERSION, key[1], key[2], os.fsencode(os.path.abspath(key[0])))
+    
+    @staticmethod
+    def _read_index_cache(
+        file_path: str,
+        key: Tuple[str, int, int]
+    ) -> Optional[Dict[bytes, List[bytes]]]:
+        """Load the cached index of a data file if it matches the file's path, size and mtime.
+        
+        After the header the file holds one 'identifier<TAB>raw line' entry
+        per line; raw lines come from bytes.splitlines, so they hold no newline.
+        """
+        header = NavigationDataService._index_cache_header(key)
+        try:
+            with open(index_cache_path(file_path), 'rb') as cache_file:
+                data = cache_file.read()
+            if not data.startswith(header):
+                return None
+            index: Dict[bytes, List[bytes]] = {}
+            for entry in data[len(header):].split(b"\n"):
+                if entry:
+                    identifier, line = entry.split(b"\t", 1)
+                    index.setdefault(identifier, []).append(line)
+            return index
+        except Exception:
+            pass  # Missing, stale or unreadable caches are simply rebuilt
+        return None
+    
+    @staticmethod
+    def _write_index_cache(
+        file_path: str,
+        key: Tuple[str, int, int],
+        index: Dict[bytes, List[bytes]]
+    ) -> None:
+        """Save an index to the cache directory; failures (e.g. no writable home) are ignored."""
+        try:
+            os.makedirs(INDEX_CACHE_DIR, exist_ok=True)
+            # Write a temporary file and rename it so readers never see a partial index
+            fd, temp_path = tempfile.mkstemp(dir=INDEX_CACHE_DIR)
+            try:
+                with os.fdopen(fd, 'wb') as cache_file:
+                    cache_file.write(NavigationDataService._index_cache_header(key))
+                    cache_file.write(b"".join(
+                        b"%s\t%s\n" % (identifier, line) for identifier, lines in index.items() for line in lines
+                    ))
+                os.replace(temp_path, index_cache_path(file_path))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError:
+            pass
+    
+    @staticmethod
+    def _scan_file(file_path: str, relevant_index: int, identifier: str) -> List[List[str]]:
+        """Scan a data file for one identifier, splitting only lines that contain it."""
+        needle = identifier.encode()
+        matching_lines = []
+        if not needle:
+            return matching_lines  # An empty identifier matches no field
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return matching_lines  # mmap cannot map an empty file
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                pos = buffer.find(needle)
+                while pos != -1:
+                    start = buffer.rfind(b'\n', 0, pos) + 1
+                    end = buffer.find(b'\n', pos)
+                    if end == -1:
+                        end = len(buffer)
+                    parts = buffer[start:end].decode(errors='replace').split()
+                    if len(parts) > relevant_index and parts[relevant_index] == identifier:
+                        matching_lines.append(parts)
+                    pos = buffer.find(needle, end + 1)  # Past the newline, so the scan always advances
+        return matching_lines
+    
+    @staticmethod
+    def _load_index(file_path: str, relevant_index: int) -> Dict[bytes, List[bytes]]:
+        """Read a data file once and group its raw lines by identifier.
+        
+        The file is read as bytes in one call and split with bytes.splitlines,
+        avoiding per-line readline and decode overhead. Only the fields up to
+        the identifier are split here; lines are decoded and split fully when
+        a lookup returns them.
+        """
+        index: Dict[bytes, List[bytes]] = {}
+        maxsplit = relevant_index + 1
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        for line in data.splitlines():
+            parts = line.split(None, maxsplit)
+            if len(parts) > relevant_index:
+                index.setdefault(parts[relevant_index], []).append(line)
+        return index
 
 class InputValidator:
     """Validates user input for the application."""
     
+    @staticmethod
+    def _parse_float(value: str, name: str) -> float:
+        """Convert an entry value to float, naming the field on failure."""
+        try:
+            return float(value)
+        except ValueError:
+            raise ValueError(f"{name} must be a number") from None
+    
     @staticmethod
     def validate_coordinates(coords_str: str) -> Coordinates:
         """Validate and parse coordinate string."""
+        # A fresh instance each call, since Coordinates is mutable
+        return Coordinates(*InputValidator._parse_coordinates(coords_str))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=COORDINATE_PARSE_CACHE_SIZE)
+    def _parse_coordinates(coords_str: str) -> Tuple[float, float]:
+        """Parse and range-check a coordinate string (memoized; errors are not cached)."""
         if not coords_str.strip():
             raise ValueError("Coordinates cannot be empty")
         
@@ -446,7 +1447,8 @@ class InputValidator:
         
         try:
             lat, lon = map(float, parts)
-            return Coordinates(lat, lon)
+            Coordinates(lat, lon)  # Range check only
+            return lat, lon
         except ValueError as e:
             if "could not convert" in str(e):
                 raise ValueError("Coordinates must be valid numbers")
@@ -455,28 +1457,18 @@ class InputValidator:
     @staticmethod
     def validate_bearing(bearing_str: str) -> float:
         """Validate bearing input."""
-        try:
-            bearing = float(bearing_str)
-            if not (0 <= bearing < 360):
-                raise ValueError("Bearing should be within 0-359 degrees")
-            return bearing
-        except ValueError as e:
-            if "could not convert" in str(e):
-                raise ValueError("Bearing must be a number")
-            raise e
+        bearing = InputValidator._parse_float(bearing_str, "Bearing")
+        if not (0 <= bearing < 360):
+            raise ValueError("Bearing should be within 0-359 degrees")
+        return bearing
     
     @staticmethod
     def validate_distance(distance_str: str) -> float:
         """Validate distance input."""
-        try:
-            distance = float(distance_str)
-            if distance <= 0:
-                raise ValueError("Distance should be greater than 0 nautical miles")
-            return distance
-        except ValueError as e:
-            if "could not convert" in str(e):
-                raise ValueError("Distance must be a number")
-            raise e
+        distance = InputValidator._parse_float(distance_str, "Distance")
+        if distance <= 0:
+            raise ValueError("Distance should be greater than 0 nautical miles")
+        return distance
     
     @staticmethod
     def validate_airport_code(airport_code: str) -> str:
@@ -484,7 +1476,8 @@ class InputValidator:
         code = airport_code.strip().upper()
         if len(code) != 4:
             raise ValueError("Airport code must be 4 letters")
-        if not code.isalpha():
+        # isascii keeps non-Latin letters out; both checks are single C calls
+        if not (code.isascii() and code.isalpha()):
             raise ValueError("Airport code must contain only letters")
         return code
     
@@ -495,10 +1488,27 @@ class InputValidator:
             return vor_id
         
         code = vor_id.strip().upper()
-        if not (1 <= len(code) <= 3 and code.isalpha()):
+        if not (1 <= len(code) <= 3 and code.isascii() and code.isalpha()):
             raise ValueError("VOR identifier should be 1-3 letters and alphabetic")
         return code
     
+    @staticmethod
+    def validate_waypoint_inputs(
+        coordinates: Coordinates,
+        bearing_str: str,
+        distance_str: str,
+        airport_code: str,
+        vor_id: str
+    ) -> WaypointInputs:
+        """Validate the raw waypoint entries and return them normalized (coordinates are already parsed)."""
+        return WaypointInputs(
+            coordinates=coordinates,
+            bearing=InputValidator.validate_bearing(bearing_str),
+            distance_nm=InputValidator.validate_distance(distance_str),
+            airport_code=InputValidator.validate_airport_code(airport_code),
+            vor_identifier=InputValidator.validate_vor_identifier(vor_id)
+        )
+    
     @staticmethod
     def validate_runway_code(runway_str: str) -> int:
         """Validate runway code."""
@@ -597,6 +1607,35 @@ class BaseCalculationFrame:
         self.bearing_mode = tk.StringVar(value=BearingMode.MAGNETIC.value)
         self.declination_mode = tk.StringVar(value=DeclinationMode.MANUAL.value)
         self.auto_declination_value = 0.0
+        # entry -> (text written, Coordinates) for coordinates set by the application
+        self._entry_coordinates: Dict[tk.Entry, Tuple[str, Coordinates]] = {}
+    
+    def _show_coordinates(self, entry: tk.Entry, coordinates: Coordinates) -> None:
+        """Write coordinates into an entry, remembering them so reading them back skips parsing."""
+        text = str(coordinates)
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
+        self._entry_coordinates[entry] = (text, coordinates)
+    
+    def _read_coordinates(self, entry: tk.Entry, text: Optional[str] = None) -> Coordinates:
+        """Return the coordinates in an entry, parsing the text only if the user has edited it."""
+        if text is None:
+            text = entry.get()
+        text = text.strip()
+        cached = self._entry_coordinates.get(entry)
+        if cached is not None and cached[0] == text:
+            return cached[1]
+        return InputValidator.validate_coordinates(text)
+    
+    def _clear_entries(self, *entries: tk.Entry) -> None:
+        """Empty several entries with a single Tcl evaluation."""
+        self.frame.tk.eval("; ".join(f"{entry} delete 0 end" for entry in entries))
+    
+    @staticmethod
+    def _bind_return(entries: Tuple[tk.Entry, ...], command) -> None:
+        """Run command when Return is pressed in any of the entries."""
+        for entry in entries:
+            entry.bind("<Return>", lambda event: command())
     
     def _create_bearing_mode_widgets(self, row: int):
         """Create bearing mode selection widgets."""
@@ -684,6 +1723,119 @@ class BaseCalculationFrame:
     def pack_forget(self):
         """Hide the frame."""
         self.frame.pack_forget()
+    
+    def _lookup_identifier(
+        self,
+        identifier: str,
+        setter,
+        file_type: Optional[FileType] = None,
+        label: Optional[str] = None,
+        line_filter=None
+    ) -> None:
+        """Look up an identifier and pass the (chosen) matching entry to setter.
+        
+        The file type defaults to the one selected in the frame, and the label
+        used in the not-found message defaults to the file type's name.
+        """
+        try:
+            if file_type is None:
+                file_type = FileType(self.search_file_type.get())
+            if label is None:
+                label = file_type.value
+            matching_lines = self.nav_data_service.search_identifier(identifier, file_type)
+            if line_filter is not None:
+                matching_lines = [line for line in matching_lines if line_filter(line)]
+            
+            if not matching_lines:
+                messagebox.showinfo("Not Found", f"{label} identifier '{identifier}' not found.")
+                return
+            
+            if len(matching_lines) > 1:
+                self._handle_duplicate_entries(matching_lines, setter, IDENTIFIER_COLUMNS[file_type])
+            else:
+                setter(matching_lines[0])
+                
+        except Exception as e:
+            messagebox.showerror("Search Error", str(e))
+    
+    def _handle_duplicate_entries(
+        self, 
+        matching_lines: List[List[str]], 
+        callback, 
+        relevant_index: int
+    ):
+        """Handle multiple entries with the same identifier."""
+        choice_window = tk.Toplevel(self.frame)
+        choice_window.title("Choose Entry")
+        tk.Label(choice_window, text="Multiple entries found. Please choose one:").pack()
+        
+        # One Treeview row per entry rather than one widget per entry
+        frame = tk.Frame(choice_window)
+        frame.pack(fill="both", expand=True, padx=5, pady=5)
+        
+        scrollbar = tk.Scrollbar(frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        columns = ("Type", "Identifier", "Location")
+        choice_tree = ttk.Treeview(
+            frame,
+            columns=columns,
+            show="headings",
+            selectmode="browse",
+            height=min(len(matching_lines), 15),
+            yscrollcommand=scrollbar.set
+        )
+        for column in columns:
+            choice_tree.heading(column, text=column)
+            choice_tree.column(column, width=150 if column == "Location" else 100, anchor="w")
+        
+        for line_number, line_parts in enumerate(matching_lines):
+            # Skip empty lines and lines without the identifier column
+            if len(line_parts) <= relevant_index:
+                continue
+            
+            type_str = NAV_TYPE_DESCRIPTIONS.get(line_parts[0], "Unknown")
+            location = line_parts[9] if len(line_parts) > 9 else "[Location missing]"
+            # The row id indexes back into matching_lines
+            choice_tree.insert(
+                "", "end", iid=str(line_number), values=(type_str, line_parts[relevant_index], location)
+            )
+        
+        choice_tree.pack(side=tk.LEFT, fill="both", expand=True)
+        scrollbar.config(command=choice_tree.yview)
+        
+        def confirm_choice(event=None):
+            # Double-clicks only confirm when they land on a row
+            if event is not None and choice_tree.identify_region(event.x, event.y) != "cell":
+                return
+            selected_items = choice_tree.selection()
+            if selected_items:
+                callback(matching_lines[int(selected_items[0])])
+                choice_window.destroy()
+            else:
+                messagebox.showwarning("Selection Required", "Please select an entry.")
+        
+        choice_tree.bind("<Double-1>", confirm_choice)
+        
+        btn_confirm = tk.Button(choice_window, text="Confirm", command=confirm_choice)
+        btn_confirm.pack()
+        choice_window.wait_window()
+
+# Waypoint output templates keyed by (beyond the radius-letter range, VOR identifier given).
+# Arguments: coordinates, VOR identifier, bearing (int), rounded distance (int),
+# distance (NM), airport code, operation code.
+WAYPOINT_OUTPUT_FORMATS = {
+    (True, True): lambda coords, vor, brg, dist, dist_nm, apt, op: (
+        f"{coords} {vor}{dist} {apt} {apt[:2]} {op} {vor}{brg:03d}{dist:03d}"),
+    (True, False): lambda coords, vor, brg, dist, dist_nm, apt, op: (
+        f"{coords} {dist} {apt} {apt[:2]} {op}"),
+    (False, True): lambda coords, vor, brg, dist, dist_nm, apt, op: (
+        f"{coords} D{brg:03d}{CoordinateCalculator.get_radius_letter(dist_nm)} "
+        f"{apt} {apt[:2]} {op} {vor}{brg:03d}{dist:03d}"),
+    (False, False): lambda coords, vor, brg, dist, dist_nm, apt, op: (
+        f"{coords} D{brg:03d}{CoordinateCalculator.get_radius_letter(dist_nm)} "
+        f"{apt} {apt[:2]} {op}"),
+}
 
 class WaypointCalculationFrame(BaseCalculationFrame):
     """Frame for waypoint calculations."""
@@ -810,6 +1962,12 @@ class WaypointCalculationFrame(BaseCalculationFrame):
         )
         btn_update_decl.grid(row=2, column=2, padx=5, pady=5)
         
+        self._entries = (
+            self.entry_identifier, self.entry_coords, self.entry_bearing, self.entry_distance,
+            self.entry_declination, self.entry_airport_code, self.entry_vor_identifier
+        )
+        self._bind_return(self._entries, self.calculate)
+        
         self._update_bearing_label()
     
     def _update_bearing_label(self):
@@ -833,95 +1991,28 @@ class WaypointCalculationFrame(BaseCalculationFrame):
             self.declination_label.grid_remove()
             self.entry_declination.grid_remove()
     
-    def search_coordinates(self):
+    def search_coordinates(self, identifier: Optional[str] = None):
         """Search for coordinates based on identifier."""
-        identifier = self.entry_identifier.get().strip().upper()
+        if identifier is None:
+            identifier = self.entry_identifier.get()
+        identifier = identifier.strip().upper()
         if not identifier:
             messagebox.showerror("Input Error", "Please enter an identifier.")
             return
         
-        try:
-            file_type = FileType(self.search_file_type.get())
-            matching_lines = self.nav_data_service.search_identifier(identifier, file_type)
-            
-            if not matching_lines:
-                messagebox.showinfo(
-                    "Not Found", 
-                    f"{file_type.value} identifier '{identifier}' not found."
-                )
-                return
-            
-            if len(matching_lines) > 1:
-                self._handle_duplicate_entries(matching_lines)
-            else:
-                self._set_coordinates(matching_lines[0])
-                
-        except Exception as e:
-            messagebox.showerror("Search Error", str(e))
-    
-    def _handle_duplicate_entries(self, matching_lines: List[List[str]]):
-        """Handle multiple entries with the same identifier."""
-        choice_window = tk.Toplevel(self.frame)
-        choice_window.title("Choose Entry")
-        tk.Label(choice_window, text="Multiple entries found. Please choose one:").pack()
-        
-        selected_line = tk.StringVar()
-        file_type = FileType(self.search_file_type.get())
-        
-        for line_parts in matching_lines:
-            # Check if we have enough data to safely access indices
-            if not line_parts:
-                continue  # Skip empty lines
-            
-            first_part = line_parts[0]
-            type_str = NAV_TYPE_DESCRIPTIONS.get(first_part, "Unknown")
-            relevant_index = 7 if file_type == FileType.NAV else 2
-            
-            # Check if we have enough parts for the relevant index
-            if len(line_parts) <= relevant_index:
-                continue  # Skip lines with insufficient data
-                
-            display_text = f"{type_str} - {line_parts[relevant_index]}"
-            
-            if len(line_parts) > 9:
-                display_text += f" - {line_parts[9]}"
-            else:
-                display_text += " - [Location missing]"
-            
-            rb = tk.Radiobutton(
-                choice_window,
-                text=display_text,
-                variable=selected_line,
-                value=",".join(line_parts)
-            )
-            rb.pack()
-        
-        def confirm_choice():
-            chosen_line = selected_line.get()
-            if chosen_line:
-                self._set_coordinates(chosen_line.split(","))
-                choice_window.destroy()
-            else:
-                messagebox.showwarning("Selection Required", "Please select an entry.")
-        
-        btn_confirm = tk.Button(choice_window, text="Confirm", command=confirm_choice)
-        btn_confirm.pack()
-        choice_window.wait_window()
+        self._lookup_identifier(identifier, self._set_coordinates)
     
     def _set_coordinates(self, line_parts: List[str]):
         """Set coordinates from search results."""
         try:
-            file_type = FileType(self.search_file_type.get())
-            lat_index = 1 if file_type == FileType.NAV else 0
-            lon_index = 2 if file_type == FileType.NAV else 1
+            lat_index, lon_index = COORDINATE_COLUMNS[FileType(self.search_file_type.get())]
             
             # Check if we have enough data
             if len(line_parts) <= max(lat_index, lon_index):
                 raise IndexError("Insufficient coordinate data in file entry")
             
             coordinates = Coordinates(float(line_parts[lat_index]), float(line_parts[lon_index]))
-            self.entry_coords.delete(0, tk.END)
-            self.entry_coords.insert(0, str(coordinates))
+            self._show_coordinates(self.entry_coords, coordinates)
             
         except (ValueError, IndexError) as e:
             messagebox.showerror("Data Error", f"Invalid coordinate data in the selected file: {str(e)}")
@@ -937,7 +2028,7 @@ class WaypointCalculationFrame(BaseCalculationFrame):
                 )
                 return
             
-            coordinates = InputValidator.validate_coordinates(coords_str)
+            coordinates = self._read_coordinates(self.entry_coords, coords_str)
             declination = self.declination_service.get_declination(coordinates)
             
             self.auto_declination_value = declination
@@ -958,74 +2049,61 @@ class WaypointCalculationFrame(BaseCalculationFrame):
     def calculate(self):
         """Perform waypoint calculation."""
         try:
-            # Validate all inputs
+            # Read every entry once; validation works on the local copies
             coords_str = self.entry_coords.get().strip()
-            coordinates = None
+            identifier = self.entry_identifier.get().strip()
+            bearing_str = self.entry_bearing.get()
+            distance_str = self.entry_distance.get()
+            airport_code_str = self.entry_airport_code.get()
+            vor_identifier_str = self.entry_vor_identifier.get()
+            bearing_mode = BearingMode(self.bearing_mode.get())
+            operation_code = OPERATION_CODES[self.combo_operation_type.get()]
             
-            if coords_str:
-                coordinates = InputValidator.validate_coordinates(coords_str)
-            elif self.entry_identifier.get().strip():
+            if not coords_str:
+                if not identifier:
+                    raise ValueError("Please enter identifier or coordinates.")
                 # Try to search for coordinates first
-                self.search_coordinates()
+                self.search_coordinates(identifier)
                 coords_str = self.entry_coords.get().strip()
-                if coords_str:
-                    coordinates = InputValidator.validate_coordinates(coords_str)
-                else:
-                    messagebox.showerror("Input Error", "Could not find coordinates for identifier.")
-                    return
-            else:
-                messagebox.showerror("Input Error", "Please enter identifier or coordinates.")
-                return
+                if not coords_str:
+                    raise ValueError("Could not find coordinates for identifier.")
             
-            bearing = InputValidator.validate_bearing(self.entry_bearing.get())
-            distance_nm = InputValidator.validate_distance(self.entry_distance.get())
-            airport_code = InputValidator.validate_airport_code(self.entry_airport_code.get())
-            vor_identifier = InputValidator.validate_vor_identifier(self.entry_vor_identifier.get())
+            inputs = InputValidator.validate_waypoint_inputs(
+                self._read_coordinates(self.entry_coords, coords_str), bearing_str, distance_str,
+                airport_code_str, vor_identifier_str
+            )
+            coordinates = inputs.coordinates
+            bearing = inputs.bearing
+            distance_nm = inputs.distance_nm
+            airport_code = inputs.airport_code
+            vor_identifier = inputs.vor_identifier
             
             # Calculate effective declination
             declination = self._get_effective_declination(coordinates)
             
             # Convert to true bearing if needed
-            bearing_mode = BearingMode(self.bearing_mode.get())
             if bearing_mode == BearingMode.MAGNETIC:
-                true_bearing = (bearing + declination) % 360
+                true_bearing = self.calculator.normalize_bearing(bearing + declination)
             else:
-                true_bearing = bearing % 360
+                true_bearing = self.calculator.normalize_bearing(bearing)
             
             # Calculate target coordinates
             target_coords = self.calculator.calculate_target_coords_geodesic(
                 coordinates, true_bearing, distance_nm
             )
             
-            # Generate output
-            radius_letter = self.calculator.get_radius_letter(distance_nm)
-            operation_code = OPERATION_CODES[self.combo_operation_type.get()]
-            
-            if distance_nm > 26.5:
-                rounded_distance_nm_int = int(round(distance_nm))
-                output = (f"{target_coords} "
-                         f"{vor_identifier}{rounded_distance_nm_int} "
-                         f"{airport_code} {airport_code[:2]}")
-                if vor_identifier:
-                    bearing_int = int(bearing)
-                    output += f" {operation_code} {vor_identifier}{bearing_int:03d}{rounded_distance_nm_int:03d}"
-                else:
-                    output += f" {operation_code}"
-            else:
-                output = (f"{target_coords} "
-                         f"D{int(bearing):03d}{radius_letter} "
-                         f"{airport_code} {airport_code[:2]}")
-                if vor_identifier:
-                    bearing_int = int(bearing)
-                    output += f" {operation_code} {vor_identifier}{bearing_int:03d}{int(round(distance_nm)):03d}"
-                else:
-                    output += f" {operation_code}"
+            # Generate output with the template specialized for this input shape
+            format_output = WAYPOINT_OUTPUT_FORMATS[(distance_nm > 26.5, bool(vor_identifier))]
+            output = format_output(
+                target_coords, vor_identifier, int(bearing), int(round(distance_nm)),
+                distance_nm, airport_code, operation_code
+            )
             
             # Create result
             result = CalculationResult(
                 coordinates=target_coords,
                 output_string=output,
-                timestamp=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                timestamp=time.time(),
                 mode=AppMode.WAYPOINT
             )
             
@@ -1038,13 +2116,7 @@ class WaypointCalculationFrame(BaseCalculationFrame):
     
     def clear_fields(self):
         """Clear all input fields."""
-        self.entry_identifier.delete(0, tk.END)
-        self.entry_coords.delete(0, tk.END)
-        self.entry_bearing.delete(0, tk.END)
-        self.entry_distance.delete(0, tk.END)
-        self.entry_declination.delete(0, tk.END)
-        self.entry_airport_code.delete(0, tk.END)
-        self.entry_vor_identifier.delete(0, tk.END)
+        self._clear_entries(*self._entries)
 
 class FixCalculationFrame(BaseCalculationFrame):
     """Frame for FIX calculations."""
@@ -1235,6 +2307,18 @@ class FixCalculationFrame(BaseCalculationFrame):
         )
         btn_search_fix.grid(row=1, column=2, padx=5, pady=5)
         
+        # Return runs the calculation of the section the entry belongs to
+        dme_entries = (
+            self.entry_dme_identifier, self.entry_dme_coords, self.entry_dme_bearing,
+            self.entry_dme_distance, self.entry_dme_declination
+        )
+        fix_entries = (
+            self.entry_fix_identifier, self.entry_fix_coords, self.entry_runway_code, self.entry_fix_airport_code
+        )
+        self._bind_return(dme_entries, self.calculate_from_dme)
+        self._bind_return(fix_entries, self.calculate_fix)
+        self._entries = fix_entries[:2] + dme_entries + fix_entries[2:]
+        
         self._update_bearing_label()
     
     def _update_bearing_label(self):
@@ -1265,24 +2349,7 @@ class FixCalculationFrame(BaseCalculationFrame):
             messagebox.showerror("Input Error", "Please enter a FIX identifier.")
             return
         
-        try:
-            file_type = FileType(self.search_file_type.get())
-            matching_lines = self.nav_data_service.search_identifier(identifier, file_type)
-            
-            if not matching_lines:
-                messagebox.showinfo(
-                    "Not Found",
-                    f"{file_type.value} identifier '{identifier}' not found."
-                )
-                return
-            
-            if len(matching_lines) > 1:
-                self._handle_duplicate_entries(matching_lines, self._set_fix_coords)
-            else:
-                self._set_fix_coords(matching_lines[0])
-                
-        except Exception as e:
-            messagebox.showerror("Search Error", str(e))
+        self._lookup_identifier(identifier, self._set_fix_coords)
     
     def search_dme_coords(self):
         """Search for DME coordinates."""
@@ -1291,89 +2358,22 @@ class FixCalculationFrame(BaseCalculationFrame):
             messagebox.showerror("Input Error", "Please enter a DME identifier.")
             return
         
-        try:
-            matching_lines = self.nav_data_service.search_identifier(identifier, FileType.NAV)
-            
-            # Filter for DME types
-            dme_lines = [
-                line for line in matching_lines 
-                if len(line) > 0 and line[0] in ['12', '13']
-            ]
-            
-            if not dme_lines:
-                messagebox.showinfo("Not Found", f"DME identifier '{identifier}' not found.")
-                return
-            
-            if len(dme_lines) > 1:
-                self._handle_duplicate_entries(dme_lines, self._set_dme_coords)
-            else:
-                self._set_dme_coords(dme_lines[0])
-                
-        except Exception as e:
-            messagebox.showerror("Search Error", str(e))
-    
-    def _handle_duplicate_entries(self, matching_lines: List[List[str]], callback):
-        """Handle multiple entries with same identifier."""
-        choice_window = tk.Toplevel(self.frame)
-        choice_window.title("Choose Entry")
-        tk.Label(choice_window, text="Multiple entries found. Please choose one:").pack()
-        
-        selected_line = tk.StringVar()
-        
-        for line_parts in matching_lines:
-            # Check if we have enough data to safely access indices
-            if not line_parts:
-                continue  # Skip empty lines
-                
-            first_part = line_parts[0]
-            type_str = NAV_TYPE_DESCRIPTIONS.get(first_part, "Unknown")
-            relevant_index = 7
-            
-            # Check if we have enough parts for the relevant index
-            if len(line_parts) <= relevant_index:
-                continue  # Skip lines with insufficient data
-                
-            display_text = f"{type_str} - {line_parts[relevant_index]}"
-            
-            if len(line_parts) > 9:
-                display_text += f" - {line_parts[9]}"
-            else:
-                display_text += " - [Location missing]"
-            
-            rb = tk.Radiobutton(
-                choice_window,
-                text=display_text,
-                variable=selected_line,
-                value=",".join(line_parts)
-            )
-            rb.pack()
-        
-        def confirm_choice():
-            chosen_line = selected_line.get()
-            if chosen_line:
-                callback(chosen_line.split(","))
-                choice_window.destroy()
-            else:
-                messagebox.showwarning("Selection Required", "Please select an entry.")
-        
-        btn_confirm = tk.Button(choice_window, text="Confirm", command=confirm_choice)
-        btn_confirm.pack()
-        choice_window.wait_window()
+        self._lookup_identifier(
+            identifier, self._set_dme_coords, FileType.NAV, "DME",
+            line_filter=lambda line: len(line) > 0 and line[0] in DME_NAV_TYPES
+        )
     
     def _set_fix_coords(self, line_parts: List[str]):
         """Set FIX coordinates from search results."""
         try:
-            file_type = FileType(self.search_file_type.get())
-            lat_index = 0 if file_type == FileType.FIX else 1
-            lon_index = 1 if file_type == FileType.FIX else 2
+            lat_index, lon_index = COORDINATE_COLUMNS[FileType(self.search_file_type.get())]
             
             # Check if we have enough data
             if len(line_parts) <= max(lat_index, lon_index):
                 raise IndexError("Insufficient coordinate data in file entry")
             
             coordinates = Coordinates(float(line_parts[lat_index]), float(line_parts[lon_index]))
-            self.entry_fix_coords.delete(0, tk.END)
-            self.entry_fix_coords.insert(0, str(coordinates))
+            self._show_coordinates(self.entry_fix_coords, coordinates)
             
         except (ValueError, IndexError) as e:
             messagebox.showerror("Data Error", f"Invalid coordinate data in the selected file: {str(e)}")
@@ -1386,8 +2386,7 @@ class FixCalculationFrame(BaseCalculationFrame):
                 raise IndexError("Insufficient coordinate data in DME entry")
             
             coordinates = Coordinates(float(line_parts[1]), float(line_parts[2]))
-            self.entry_dme_coords.delete(0, tk.END)
-            self.entry_dme_coords.insert(0, str(coordinates))
+            self._show_coordinates(self.entry_dme_coords, coordinates)
         except (ValueError, IndexError) as e:
             messagebox.showerror("Data Error", f"Invalid coordinate data in the selected DME: {str(e)}")
     
@@ -1402,7 +2401,7 @@ class FixCalculationFrame(BaseCalculationFrame):
                 )
                 return
             
-            coordinates = InputValidator.validate_coordinates(coords_str)
+            coordinates = self._read_coordinates(self.entry_dme_coords, coords_str)
             declination = self.declination_service.get_declination(coordinates)
             
             self.auto_declination_value = declination
@@ -1423,42 +2422,44 @@ class FixCalculationFrame(BaseCalculationFrame):
     def calculate_from_dme(self):
         """Calculate intersection from DME data."""
         try:
+            # Read every widget once; validation works on the local copies
+            fix_coords_str = self.entry_fix_coords.get()
+            dme_coords_str = self.entry_dme_coords.get()
+            bearing_str = self.entry_dme_bearing.get()
+            distance_str = self.entry_dme_distance.get()
+            bearing_mode = BearingMode(self.bearing_mode.get())
+            distance_reference = self.distance_reference.get()
+            
             # Get and validate FIX coordinates
-            fix_coords = InputValidator.validate_coordinates(self.entry_fix_coords.get())
+            fix_coords = self._read_coordinates(self.entry_fix_coords, fix_coords_str)
             
             # Get and validate DME coordinates
-            dme_coords = InputValidator.validate_coordinates(self.entry_dme_coords.get())
+            dme_coords = self._read_coordinates(self.entry_dme_coords, dme_coords_str)
             
             # Get and validate bearing and distance
-            bearing = InputValidator.validate_bearing(self.entry_dme_bearing.get())
-            distance_nm = InputValidator.validate_distance(self.entry_dme_distance.get())
+            bearing = InputValidator.validate_bearing(bearing_str)
+            distance_nm = InputValidator.validate_distance(distance_str)
             
             # Calculate effective declination
             declination = self._get_effective_declination(dme_coords)
             
             # Convert to true bearing
-            bearing_mode = BearingMode(self.bearing_mode.get())
             if bearing_mode == BearingMode.MAGNETIC:
-                true_bearing = (bearing + declination) % 360
+                true_bearing = self.calculator.normalize_bearing(bearing + declination)
             else:
-                true_bearing = bearing % 360
+                true_bearing = self.calculator.normalize_bearing(bearing)
             
-            distance_reference = self.distance_reference.get()
-            start_time = datetime.datetime.now()
+            start_time = time.perf_counter()
             
             if distance_reference == "DME":
                 # Find intersection of radial from FIX with circle around DME
-                intersection_point = self._find_radial_distance_intersection(
+                intersection = self.calculator.find_radial_distance_intersection(
                     fix_coords, true_bearing, dme_coords, distance_nm
                 )
+                intersection_point = intersection.coordinates
                 
-                # Verify accuracy
-                verification = GEODESIC.Inverse(
-                    intersection_point.lat, intersection_point.lon,
-                    dme_coords.lat, dme_coords.lon
-                )
-                actual_distance_nm = verification['s12'] / 1852
-                accuracy_error_nm = abs(actual_distance_nm - distance_nm)
+                # The solver's final residual is the distance error
+                accuracy_error_nm = self.calculator.meters_to_nm(intersection.residual_m)
             else:
                 # Calculate directly from FIX
                 try:
@@ -1469,12 +2470,10 @@ class FixCalculationFrame(BaseCalculationFrame):
                 except Exception as e:
                     raise Exception(f"Error calculating coordinates from FIX: {str(e)}")
             
-            end_time = datetime.datetime.now()
-            elapsed_ms = (end_time - start_time).total_seconds() * 1000
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
             
             # Update FIX coordinates with intersection point
-            self.entry_fix_coords.delete(0, tk.END)
-            self.entry_fix_coords.insert(0, str(intersection_point))
+            self._show_coordinates(self.entry_fix_coords, intersection_point)
             
             bearing_type = "magnetic" if bearing_mode == BearingMode.MAGNETIC else "true"
             declination_info = f" (declination: {declination:.1f}°)" if bearing_mode == BearingMode.MAGNETIC else ""
@@ -1498,196 +2497,10 @@ class FixCalculationFrame(BaseCalculationFrame):
         except Exception as e:
             messagebox.showerror("Calculation Error", f"Error during calculation: {e}")
     
-    def _find_radial_distance_intersection(
-        self, 
-        fix_coords: Coordinates, 
-        true_bearing: float, 
-        dme_coords: Coordinates, 
-        distance_nm: float
-    ) -> Coordinates:
-        """Find intersection of radial from FIX with distance circle from DME using enhanced algorithm."""
-        distance_m = self.calculator.nm_to_meters(distance_nm)
-        
-        # Try Newton-Raphson method first for better accuracy
-        try:
-            result = self._newton_raphson_intersection(fix_coords, true_bearing, dme_coords, distance_m)
-            if result is not None:
-                return result
-        except Exception:
-            pass  # Fall back to binary search if Newton-Raphson fails
-        
-        # Enhanced binary search with adaptive refinement
-        return self._enhanced_binary_search_intersection(fix_coords, true_bearing, dme_coords, distance_m)
-    
-    def _newton_raphson_intersection(
-        self, 
-        fix_coords: Coordinates, 
-        true_bearing: float, 
-        dme_coords: Coordinates, 
-        distance_m: float
-    ) -> Optional[Coordinates]:
-        """Use Newton-Raphson method for high-precision intersection finding."""
-        # Initial estimate using geometric approximation
-        fix_dme_result = GEODESIC.Inverse(fix_coords.lat, fix_coords.lon, dme_coords.lat, dme_coords.lon)
-        fix_dme_distance_m = fix_dme_result['s12']
-        
-        # Geometric solution for initial guess
-        if fix_dme_distance_m == 0:
-            initial_distance_nm = self.calculator.meters_to_nm(distance_m)
-        else:
-            # Use law of cosines for initial estimate
-            bearing_to_dme = fix_dme_result['azi1']
-            angle_diff = abs(true_bearing - bearing_to_dme)
-            angle_diff = min(angle_diff, 360 - angle_diff)  # Use smallest angle
-            angle_rad = math.radians(angle_diff)
-            
-            # Law of cosines: c² = a² + b² - 2ab*cos(C)
-            # Solve for distance along radial
-            a = fix_dme_distance_m
-            b = distance_m
-            cos_angle = math.cos(angle_rad)
-            
-            # Quadratic formula solution
-            discriminant = 4 * a * a * cos_angle * cos_angle - 4 * (a * a - b * b)
-            if discriminant < 0:
-                return None  # No real solution
-            
-            distance1 = a * cos_angle + math.sqrt(discriminant) / 2
-            distance2 = a * cos_angle - math.sqrt(discriminant) / 2
-            
-            # Choose the positive solution closest to expected range
-            initial_distance_m = max(0, min(distance1, distance2) if min(distance1, distance2) > 0 else max(distance1, distance2))
-            initial_distance_nm = self.calculator.meters_to_nm(initial_distance_m)
-        
-        # Newton-Raphson iterations
-        current_dist_nm = initial_distance_nm
-        
-        for iteration in range(MAX_ITERATIONS):
-            # Calculate current point
-            point_result = GEODESIC.Direct(
-                fix_coords.lat, fix_coords.lon, true_bearing, 
-                self.calculator.nm_to_meters(current_dist_nm)
-            )
-            current_point = Coordinates(point_result['lat2'], point_result['lon2'])
-            
-            # Calculate distance error
-            to_dme = GEODESIC.Inverse(current_point.lat, current_point.lon, dme_coords.lat, dme_coords.lon)
-            current_dist_to_dme_m = to_dme['s12']
-            error_m = current_dist_to_dme_m - distance_m
-            
-            if abs(error_m) < NEWTON_RAPHSON_TOLERANCE_M:
-                return current_point
-            
-            # Calculate numerical derivative (gradient)
-            step_size_nm = GRADIENT_STEP_SIZE
-            step_point_result = GEODESIC.Direct(
-                fix_coords.lat, fix_coords.lon, true_bearing,
-                self.calculator.nm_to_meters(current_dist_nm + step_size_nm)
-            )
-            step_point = Coordinates(step_point_result['lat2'], step_point_result['lon2'])
-            
-            step_to_dme = GEODESIC.Inverse(step_point.lat, step_point.lon, dme_coords.lat, dme_coords.lon)
-            step_dist_to_dme_m = step_to_dme['s12']
-            step_error_m = step_dist_to_dme_m - distance_m
-            
-            # Calculate derivative
-            derivative = (step_error_m - error_m) / self.calculator.nm_to_meters(step_size_nm)
-            
-            if abs(derivative) < 1e-15:  # Avoid division by zero
-                break
-            
-            # Newton-Raphson update
-            correction_m = -error_m / derivative
-            correction_nm = self.calculator.meters_to_nm(correction_m)
-            current_dist_nm += correction_nm
-            
-            # Prevent negative distances
-            if current_dist_nm < 0:
-                current_dist_nm = abs(current_dist_nm)
-        
-        return None  # Failed to converge
-    
-    def _enhanced_binary_search_intersection(
-        self, 
-        fix_coords: Coordinates, 
-        true_bearing: float, 
-        dme_coords: Coordinates, 
-        distance_m: float
-    ) -> Coordinates:
-        """Enhanced binary search with adaptive range and precision refinement."""
-        # Calculate distance between FIX and DME
-        fix_dme_result = GEODESIC.Inverse(fix_coords.lat, fix_coords.lon, dme_coords.lat, dme_coords.lon)
-        fix_dme_distance_nm = self.calculator.meters_to_nm(fix_dme_result['s12'])
-        distance_nm = self.calculator.meters_to_nm(distance_m)
-        
-        # Intelligent search range determination
-        if distance_nm < 0.05:
-            min_dist, max_dist = 0.0, 0.2
-        elif distance_nm < 0.5:
-            min_dist, max_dist = 0.0, max(1.0, distance_nm * 2)
-        else:
-            # Use geometric constraints for better range estimation
-            margin = max(1.0, distance_nm * 0.1)  # Adaptive margin
-            min_dist = max(0.0, abs(fix_dme_distance_nm - distance_nm) - margin)
-            max_dist = fix_dme_distance_nm + distance_nm + margin
-        
-        # Validate and adjust search range
-        if min_dist >= max_dist or (max_dist - min_dist) < MIN_SEARCH_RANGE_NM:
-            min_dist = 0.0
-            max_dist = max(1.0, distance_nm * 2)
-        
-        # Enhanced binary search with precision tracking
-        best_approx_distance = float('inf')
-        best_approx_point = Coordinates(fix_coords.lat, fix_coords.lon)
-        
-        # Track convergence for adaptive precision
-        last_improvement_iteration = 0
-        
-        for iteration in range(MAX_ITERATIONS):
-            test_dist = (min_dist + max_dist) / 2.0
-            test_point_result = GEODESIC.Direct(
-                fix_coords.lat, fix_coords.lon, true_bearing, 
-                self.calculator.nm_to_meters(test_dist)
-            )
-            test_point = Coordinates(test_point_result['lat2'], test_point_result['lon2'])
-            
-            # Calculate distance from test point to DME
-            test_to_dme = GEODESIC.Inverse(test_point.lat, test_point.lon, dme_coords.lat, dme_coords.lon)
-            test_to_dme_m = test_to_dme['s12']
-            
-            error_m = abs(test_to_dme_m - distance_m)
-            
-            # Track best approximation
-            if error_m < best_approx_distance:
-                best_approx_distance = error_m
-                best_approx_point = test_point
-                last_improvement_iteration = iteration
-            
-            # Check for convergence
-            if error_m < DISTANCE_TOLERANCE_M:
-                break
-            
-            # Adaptive precision: if no improvement for many iterations, use current best
-            if iteration - last_improvement_iteration > 20:
-                break
-            
-            # Adjust search range with enhanced logic
-            if test_to_dme_m > distance_m:
-                max_dist = test_dist
-            else:
-                min_dist = test_dist
-            
-            # Enhanced termination condition
-            range_size = max_dist - min_dist
-            if range_size < MIN_SEARCH_RANGE_NM:
-                break
-        
-        return best_approx_point
-    
     def calculate_fix(self):
         """Calculate FIX output."""
         try:
-            coordinates = InputValidator.validate_coordinates(self.entry_fix_coords.get())
+            coordinates = self._read_coordinates(self.entry_fix_coords)
             runway_code = InputValidator.validate_runway_code(self.entry_runway_code.get())
             airport_code = InputValidator.validate_airport_code(self.entry_fix_airport_code.get())
             
@@ -1704,7 +2517,7 @@ class FixCalculationFrame(BaseCalculationFrame):
             result = CalculationResult(
                 coordinates=coordinates,
                 output_string=output,
-                timestamp=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                timestamp=time.time(),
                 mode=AppMode.FIX
             )
             
@@ -1717,15 +2530,7 @@ class FixCalculationFrame(BaseCalculationFrame):
     
     def clear_fields(self):
         """Clear all input fields."""
-        self.entry_fix_identifier.delete(0, tk.END)
-        self.entry_fix_coords.delete(0, tk.END)
-        self.entry_dme_identifier.delete(0, tk.END)
-        self.entry_dme_coords.delete(0, tk.END)
-        self.entry_dme_bearing.delete(0, tk.END)
-        self.entry_dme_distance.delete(0, tk.END)
-        self.entry_dme_declination.delete(0, tk.END)
-        self.entry_runway_code.delete(0, tk.END)
-        self.entry_fix_airport_code.delete(0, tk.END)
+        self._clear_entries(*self._entries)
 
 class CoordinateCalculatorApp:
     """Main application class for the coordinate calculator."""
@@ -1737,16 +2542,19 @@ class CoordinateCalculatorApp:
         
         # Initialize services
         self.nav_data_service = NavigationDataService()
-        self.declination_service = MagneticDeclinationService()
+        self.declination_service = MagneticDeclinationService(initialize=False)
         self.calculator = CoordinateCalculator()
         
         # Initialize state
         self.mode_var = tk.StringVar(value=AppMode.WAYPOINT.value)
-        self.history: List[CalculationResult] = []
+        self.history = CalculationHistory()
         
         # Create UI components
         self._create_ui()
         
+        # Parsing the WMM coefficients is slow; do it once the window is built
+        self.declination_service.initialize_async()
+        
     def _create_ui(self):
         """Create the main user interface."""
         # Mode selection
@@ -1804,12 +2612,15 @@ class CoordinateCalculatorApp:
         self.mode_var.trace_add('write', self._on_mode_change)
         
     def _create_output_area(self):
-        """Create the output text area."""
+        """Create the output field."""
         frm_output = tk.LabelFrame(self.root, text="Output Result", padx=10, pady=5)
-        frm_output.pack(padx=10, pady=5, fill="both", expand=True)
+        frm_output.pack(padx=10, pady=5, fill="x")
         
-        self.output_entry = tk.Text(frm_output, width=80, height=8, state="disabled")
-        self.output_entry.pack(padx=5, pady=5, fill="both", expand=True)
+        # Outputs are single lines; a read-only entry bound to a variable is
+        # updated with one variable set and still allows selecting the text
+        self.output_var = tk.StringVar()
+        self.output_entry = tk.Entry(frm_output, width=80, textvariable=self.output_var, state="readonly")
+        self.output_entry.pack(padx=5, pady=5, fill="x")
         
     def _create_bottom_buttons(self):
         """Create the bottom button frame."""
@@ -1850,10 +2661,7 @@ class CoordinateCalculatorApp:
         self.history.append(result)
         
         # Update output display
-        self.output_entry.config(state=tk.NORMAL)
-        self.output_entry.delete(1.0, tk.END)
-        self.output_entry.insert(tk.END, result.output_string)
-        self.output_entry.config(state=tk.DISABLED)
+        self.output_var.set(result.output_string)
         
     def _clear_fields(self):
         """Clear input fields in the current mode."""
@@ -1865,13 +2673,11 @@ class CoordinateCalculatorApp:
             self.fix_frame.clear_fields()
             
         # Clear output
-        self.output_entry.config(state=tk.NORMAL)
-        self.output_entry.delete(1.0, tk.END)
-        self.output_entry.config(state=tk.DISABLED)
+        self.output_var.set("")
         
     def _copy_output(self):
         """Copy the output to clipboard."""
-        output_text = self.output_entry.get(1.0, tk.END).strip()
+        output_text = self.output_var.get().strip()
         if output_text:
             self.root.clipboard_clear()
             self.root.clipboard_append(output_text)
@@ -1900,13 +2706,33 @@ class CoordinateCalculatorApp:
         scrollbar = tk.Scrollbar(frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # Rows are inserted newest first, one chunk at a time as the view nears its end
+        history_size = len(self.history)
+        loaded_rows = 0
+        
+        def load_more_rows():
+            """Insert the next chunk of history rows."""
+            nonlocal loaded_rows
+            stop = min(loaded_rows + HISTORY_CHUNK_SIZE, history_size)
+            for i in range(loaded_rows, stop):
+                history_tree.insert(
+                    "", "end", values=self.history.display_row(history_size - 1 - i)
+                )
+            loaded_rows = stop
+        
+        def on_tree_scroll(first, last):
+            """Update the scrollbar and load more rows near the bottom."""
+            scrollbar.set(first, last)
+            if float(last) > 0.9 and loaded_rows < history_size:
+                load_more_rows()
+        
         # Create treeview for history display
         columns = ("Time", "Mode", "Output")
         history_tree = ttk.Treeview(
             frame, 
             columns=columns, 
             show="headings", 
-            yscrollcommand=scrollbar.set
+            yscrollcommand=on_tree_scroll
         )
         
         # Configure columns
@@ -1918,12 +2744,7 @@ class CoordinateCalculatorApp:
         history_tree.heading("Mode", text="Mode")
         history_tree.heading("Output", text="Output")
         
-        # Populate with history items (newest first)
-        for item in reversed(self.history):
-            history_tree.insert(
-                "", "end", 
-                values=(item.timestamp, item.mode.value, item.output_string)
-            )
+        load_more_rows()
         
         history_tree.pack(side=tk.LEFT, fill="both", expand=True)
         scrollbar.config(command=history_tree.yview)
@@ -1945,10 +2766,7 @@ class CoordinateCalculatorApp:
                 return
                 
             # Update output with selected item
-            self.output_entry.config(state=tk.NORMAL)
-            self.output_entry.delete(1.0, tk.END)
-            self.output_entry.insert(tk.END, values[2])  # Output is the third column
-            self.output_entry.config(state=tk.DISABLED)
+            self.output_var.set(values[2])  # Output is the third column
             history_window.destroy()
         
         def copy_selected_item():
@@ -1967,6 +2785,21 @@ class CoordinateCalculatorApp:
             self.root.clipboard_append(values[2])  # Output is the third column
             messagebox.showinfo("Copy", "Result copied to clipboard!")
         
+        def export_history():
+            """Export all history items to a CSV file."""
+            filepath = filedialog.asksaveasfilename(
+                title="Export History",
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            )
+            if not filepath:
+                return
+            try:
+                self.history.export_csv(filepath)
+                messagebox.showinfo("Export", f"History exported to {filepath}")
+            except OSError as e:
+                messagebox.showerror("Export Error", f"Error exporting history: {e}")
+        
         def clear_history():
             """Clear all history items."""
             if messagebox.askyesno("Clear History", "Are you sure you want to clear all history?"):
@@ -1981,6 +2814,9 @@ class CoordinateCalculatorApp:
         btn_copy = tk.Button(btn_frame, text="Copy Selected", command=copy_selected_item)
         btn_copy.pack(side=tk.LEFT, padx=5)
         
+        btn_export = tk.Button(btn_frame, text="Export", command=export_history)
+        btn_export.pack(side=tk.LEFT, padx=5)
+        
         btn_clear_history = tk.Button(btn_frame, text="Clear History", command=clear_history)
         btn_clear_history.pack(side=tk.LEFT, padx=5)
         